@@ -9,36 +9,48 @@ Flow:
   EdgeSelection → ResourceAllocation → DistillationStrategy → SimulationCheck
   → Execution → UpdateState → (loop or stop)
 
-Each node returns an immutable state update. The graph handles routing based
-on the 'action' field (continue/stop/skip).
+Each node returns a partial state update containing only the keys it changed;
+LangGraph merges it into the shared state. The graph handles routing based
+on the 'action' field (continue/stop/skip). By default run_autonomous calls
+the same nodes directly; set use_pregel=True to run through LangGraph.
 """
 
-from typing import Dict, Any, List, Optional, Tuple, TypedDict, Literal
+from typing import (
+    Annotated, Callable, Dict, Any, FrozenSet, List, Mapping, Optional, Tuple, TypedDict, Literal,
+    get_origin, get_type_hints
+)
 from dataclasses import dataclass, field
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import logging
+import math
+import operator
 
 from langgraph.graph import StateGraph, END
+from langgraph.errors import GraphRecursionError
 
 from core.client import GameClient
 from strategy.strategy import (
     EdgeSelectionStrategy,
     BudgetManager,
     AdaptiveDistillationPlanner,
-    EdgeScore
-)
-from distillation.distillation import (
-    create_bbpssw_circuit,
-    create_dejmps_circuit,
+    EdgeScore,
+    build_edge_arrays
 )
+from distillation.distillation import get_circuit_template
 from distillation.simulator import (
     DistillationSimulator,
     estimate_input_noise_from_difficulty
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the entry point (see run_langgraph_agent.py);
+# messages use lazy %-formatting so nothing is built when INFO is disabled.
 logger = logging.getLogger(__name__)
 
+# Graph supersteps per agent iteration (one per node in the chain)
+_STEPS_PER_ITERATION = 6
+
 
 # ============================================================================
 # STATE DEFINITION
@@ -54,10 +66,11 @@ class AgentState(TypedDict):
     # Game state
     current_budget: int
     current_score: int
-    owned_nodes: List[str]
-    owned_edges: List[Tuple[str, str]]
+    owned_nodes: FrozenSet[str]
+    owned_edges: FrozenSet[Tuple[str, str]]
     claimable_edges: List[Dict[str, Any]]
-    graph: Dict[str, Any]
+    claimable_edges_soa: Optional[Dict[str, Any]]  # build_edge_arrays() view
+    graph: Mapping[str, Any]  # read-only view, never copied between nodes
     
     # Decision state
     selected_edge: Optional[EdgeScore]
@@ -75,24 +88,40 @@ class AgentState(TypedDict):
     # Execution results
     execution_success: bool
     execution_response: Dict[str, Any]
+    execution_attempts: int
+    execution_outcomes: Tuple[bool, ...]  # ok flag of each attempt, in submission order
     
-    # History & control
-    iteration: int
+    # History & control (counters use an add reducer: nodes return deltas)
+    iteration: Annotated[int, operator.add]
     attempt_history: Dict[Tuple[str, str], int]
-    successful_claims: int
-    failed_attempts: int
+    successful_claims: Annotated[int, operator.add]
+    failed_attempts: Annotated[int, operator.add]
     initial_budget: int
     
     # Control flow
     action: Literal["continue", "stop", "retry", "skip"]
     stop_reason: str
+    
+    # Selection cache: bumped whenever claimable_edges is refreshed; the
+    # ranked cache holds (version, remaining candidate row indices)
+    _claimables_version: int
+    _ranked_cache: Optional[Tuple[int, Any]]  # np.ndarray of indices
+
+
+# Per-key reducers declared on AgentState, applied by the direct executor the
+# same way LangGraph applies them to channel writes
+_STATE_REDUCERS = {
+    key: hint.__metadata__[0]
+    for key, hint in get_type_hints(AgentState, include_extras=True).items()
+    if get_origin(hint) is Annotated
+}
 
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LangGraphAgentConfig:
     """Configuration for LangGraph agent."""
     # Strategy weights
@@ -112,10 +141,19 @@ class LangGraphAgentConfig:
     
     # Protocol selection
     prefer_dejmps: bool = False
+    claim_by_protocol: bool = False  # Name the protocol instead of uploading QASM
     
     # Adaptive behavior
     adaptive_risk: bool = True
     adaptive_pairs: bool = True
+    
+    # Parallel execution (1 = one claim per iteration)
+    max_parallel_attempts: int = 1
+    parallel_target_success: float = 0.99
+    
+    # Run through LangGraph's Pregel runtime (step-by-step debugging, streaming)
+    # instead of calling the nodes directly
+    use_pregel: bool = False
 
 
 # ============================================================================
@@ -136,42 +174,53 @@ class EdgeSelectionNode:
     def __init__(self, strategy: EdgeSelectionStrategy, budget_manager: BudgetManager):
         self.strategy = strategy
         self.budget_manager = budget_manager
+        # Fixed for the life of the graph; bound once instead of per call
+        self._min_reserve = budget_manager.min_reserve
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Select best edge to attempt."""
-        logger.info(f"[Iteration {state['iteration']}] EdgeSelection: Evaluating {len(state['claimable_edges'])} edges")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[Iteration %d] EdgeSelection: Evaluating %d edges",
+                        state['iteration'], len(state['claimable_edges']))
         
         # Check if we have any claimable edges
         if not state['claimable_edges']:
             return {
-                **state,
                 'action': 'stop',
                 'stop_reason': 'No claimable edges available',
                 'selected_edge': None
             }
         
-        # Build status dict for strategy
-        status = {
-            'owned_nodes': state['owned_nodes'],
-            'budget': state['current_budget']
-        }
+        # Reuse the ranking from the previous pass while the claimable set is
+        # unchanged (skip paths); UpdateState bumps the version on refresh
+        version = state.get('_claimables_version', 0)
+        edge_arrays = state.get('claimable_edges_soa')
+        if edge_arrays is None or len(edge_arrays['edge_ids']) != len(state['claimable_edges']):
+            edge_arrays = build_edge_arrays(state['claimable_edges'], state['graph'], state['owned_nodes'])
         
-        # Select best edge
-        best_edge = self.strategy.select_best_edge(
-            state['claimable_edges'],
-            state['graph'],
-            status,
-            self.budget_manager.min_reserve
-        )
+        cached = state.get('_ranked_cache')
+        if cached is not None and cached[0] == version:
+            remaining = cached[1]
+        else:
+            remaining = self.strategy.rank_edge_indices(
+                edge_arrays,
+                state['current_budget'],
+                self._min_reserve
+            )
         
-        if not best_edge:
+        if len(remaining) == 0:
             return {
-                **state,
                 'action': 'stop',
-                'stop_reason': 'No suitable edges (budget constraints)',
-                'selected_edge': None
+                'stop_reason': ('All candidate edges skipped' if cached is not None and cached[0] == version
+                                else 'No suitable edges (budget constraints)'),
+                'selected_edge': None,
+                '_ranked_cache': (version, remaining)
             }
         
+        # Pop the top candidate; a skip will move on to the next one
+        best_edge = self.strategy.edge_score_at(edge_arrays, int(remaining[0]))
+        ranked_cache = (version, remaining[1:])
+        
         # Check budget approval
         should_attempt, reason = self.budget_manager.should_attempt_edge(
             best_edge,
@@ -180,19 +229,20 @@ class EdgeSelectionNode:
         
         if not should_attempt:
             return {
-                **state,
                 'action': 'skip',
                 'stop_reason': reason,
-                'selected_edge': None
+                'selected_edge': None,
+                '_ranked_cache': ranked_cache
             }
         
         # Edge selected successfully
-        logger.info(f"  → Selected edge {best_edge.edge_id} (priority={best_edge.priority:.2f}, ROI={best_edge.roi:.2f})")
+        logger.info("  → Selected edge %s (priority=%.2f, ROI=%.2f)",
+                    best_edge.edge_id, best_edge.priority, best_edge.roi)
         
         return {
-            **state,
             'selected_edge': best_edge,
-            'action': 'continue'
+            'action': 'continue',
+            '_ranked_cache': ranked_cache
         }
 
 
@@ -210,12 +260,13 @@ class ResourceAllocationNode:
     def __init__(self, planner: AdaptiveDistillationPlanner):
         self.planner = planner
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Determine optimal Bell pair count."""
         if state['action'] != 'continue' or not state['selected_edge']:
-            return state
+            return {}
         
         edge = state['selected_edge']
+        # Read-only access: attempt_history is only copied in UpdateState
         attempt_number = state['attempt_history'].get(edge.edge_id, 0)
         
         num_pairs = self.planner.determine_bell_pair_count(
@@ -224,9 +275,9 @@ class ResourceAllocationNode:
             attempt_number
         )
         
-        logger.info(f"  → Allocated {num_pairs} Bell pairs (attempt #{attempt_number})")
+        logger.info("  → Allocated %d Bell pairs (attempt #%d)", num_pairs, attempt_number)
         
-        return {**state, 'num_bell_pairs': num_pairs}
+        return {'num_bell_pairs': num_pairs}
 
 
 class DistillationStrategyNode:
@@ -241,45 +292,65 @@ class DistillationStrategyNode:
     
     def __init__(self, config: LangGraphAgentConfig):
         self.config = config
+        # prefer_dejmps is fixed per agent; bake it into the selector once
+        self._select_protocol = self._make_protocol_selector(config.prefer_dejmps)
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Select protocol and create circuit."""
         if state['action'] != 'continue' or not state['selected_edge']:
-            return state
+            return {}
         
         edge = state['selected_edge']
+        # Read-only access: attempt_history is only copied in UpdateState
         attempt_number = state['attempt_history'].get(edge.edge_id, 0)
         
         # Protocol selection logic
         protocol = self._select_protocol(edge, attempt_number)
         
-        # Create circuit
-        if protocol == "dejmps":
-            circuit, flag_bit = create_dejmps_circuit(state['num_bell_pairs'])
-        else:  # bbpssw
-            circuit, flag_bit = create_bbpssw_circuit(state['num_bell_pairs'])
+        # Shared template: only read downstream (simulator validation, QASM export)
+        circuit, flag_bit = get_circuit_template(protocol, state['num_bell_pairs'])
         
-        logger.info(f"  → Protocol: {protocol.upper()}, flag_bit={flag_bit}")
+        logger.info("  → Protocol: %s, flag_bit=%d", protocol.upper(), flag_bit)
         
         return {
-            **state,
             'protocol': protocol,
             'circuit': circuit,
             'flag_bit': flag_bit
         }
     
-    def _select_protocol(self, edge: EdgeScore, attempt_number: int) -> str:
-        """Select distillation protocol based on edge properties."""
-        # First attempt: use heuristics
-        if attempt_number == 0:
-            # High difficulty or threshold → DEJMPS
-            if edge.difficulty >= 7 or edge.threshold >= 0.9:
-                return "dejmps"
-            # Default or configured preference
-            return "dejmps" if self.config.prefer_dejmps else "bbpssw"
+    @staticmethod
+    def _make_protocol_selector(prefer_dejmps: bool):
+        """
+        Build the protocol selector for a fixed protocol preference.
+        
+        Returns:
+            Callable (edge, attempt_number) -> protocol name
+        """
+        default = "dejmps" if prefer_dejmps else "bbpssw"
         
-        # Retry: alternate protocols
-        return "bbpssw" if attempt_number % 2 == 0 else "dejmps"
+        def select_protocol(edge: EdgeScore, attempt_number: int) -> str:
+            """Select distillation protocol based on edge properties."""
+            # First attempt: use heuristics
+            if attempt_number == 0:
+                # High difficulty or threshold → DEJMPS
+                if edge.difficulty >= 7 or edge.threshold >= 0.9:
+                    return "dejmps"
+                # Default or configured preference
+                return default
+            
+            # Retry: alternate protocols
+            return "bbpssw" if attempt_number % 2 == 0 else "dejmps"
+        
+        return select_protocol
+
+
+class _NoOpSimulator:
+    """Stand-in for DistillationSimulator when local simulation is disabled."""
+    
+    _RESULT = (True, "Simulation disabled", {'estimated_fidelity': 0.0, 'success_probability': 0.0})
+    
+    def should_submit(self, circuit, flag_bit, num_bell_pairs, threshold, input_noise, protocol="bbpssw"):
+        return self._RESULT
 
 
 class SimulationCheckNode:
@@ -294,22 +365,13 @@ class SimulationCheckNode:
     """
     
     def __init__(self, simulator: Optional[DistillationSimulator]):
-        self.simulator = simulator
+        # None means simulation is disabled; the stand-in approves everything
+        self.simulator = simulator if simulator is not None else _NoOpSimulator()
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Simulate circuit and decide whether to submit."""
         if state['action'] != 'continue' or not state['selected_edge']:
-            return state
-        
-        # Skip simulation if disabled
-        if not self.simulator:
-            return {
-                **state,
-                'should_submit': True,
-                'simulation_reason': "Simulation disabled",
-                'estimated_fidelity': 0.0,
-                'estimated_success_prob': 0.0
-            }
+            return {}
         
         edge = state['selected_edge']
         input_noise = estimate_input_noise_from_difficulty(edge.difficulty)
@@ -320,16 +382,16 @@ class SimulationCheckNode:
             state['flag_bit'],
             state['num_bell_pairs'],
             edge.threshold,
-            input_noise
+            input_noise,
+            state['protocol']
         )
         
         estimated_fidelity = sim_results.get('estimated_fidelity', 0.0)
         estimated_success_prob = sim_results.get('success_probability', 0.0)
         
         if not should_submit:
-            logger.info(f"  → Simulation REJECTED: {reason}")
+            logger.info("  → Simulation REJECTED: %s", reason)
             return {
-                **state,
                 'should_submit': should_submit,
                 'simulation_reason': reason,
                 'estimated_fidelity': estimated_fidelity,
@@ -337,9 +399,9 @@ class SimulationCheckNode:
                 'action': 'skip'
             }
         else:
-            logger.info(f"  → Simulation PASSED: F={estimated_fidelity:.3f}, P={estimated_success_prob:.2%}")
+            logger.info("  → Simulation PASSED: F=%.3f, P=%.2f%%",
+                        estimated_fidelity, estimated_success_prob * 100)
             return {
-                **state,
                 'should_submit': should_submit,
                 'simulation_reason': reason,
                 'estimated_fidelity': estimated_fidelity,
@@ -357,51 +419,127 @@ class ExecutionNode:
     - Record success/failure
     """
     
-    def __init__(self, client: GameClient):
+    def __init__(self, client: GameClient, config: Optional[LangGraphAgentConfig] = None):
         self.client = client
+        self.config = config or LangGraphAgentConfig()
+        self._max_parallel_attempts = self.config.max_parallel_attempts
+        self._enable_simulation = self.config.enable_simulation
+        self._min_reserve = self.config.min_reserve
+        self._max_retries_per_edge = self.config.max_retries_per_edge
+        self._parallel_target_success = self.config.parallel_target_success
+        self._claim_by_protocol = self.config.claim_by_protocol
+        # Long-lived pool for parallel attempts only; a single claim runs inline
+        if self._max_parallel_attempts > 1:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_parallel_attempts)
+        else:
+            self._pool = None
     
-    def __call__(self, state: AgentState) -> AgentState:
-        """Execute edge claim."""
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
+        """Execute edge claim (k parallel attempts when enabled)."""
         if state['action'] != 'continue' or not state['selected_edge'] or not state['should_submit']:
             # Skip execution
             return {
-                **state,
                 'execution_success': False,
-                'execution_response': {}
+                'execution_response': {},
+                'execution_attempts': 0,
+                'execution_outcomes': ()
             }
         
         edge = state['selected_edge']
+        k = self._num_attempts(state)
+        if self._claim_by_protocol:
+            claim = partial(self.client.claim_edge_by_protocol,
+                            edge.edge_id, state['protocol'], state['num_bell_pairs'])
+        else:
+            claim = partial(self.client.claim_edge,
+                            edge.edge_id, state['circuit'], state['flag_bit'], state['num_bell_pairs'])
         
-        try:
-            # Submit to server
-            result = self.client.claim_edge(
-                edge.edge_id,
-                state['circuit'],
-                state['flag_bit'],
-                state['num_bell_pairs']
-            )
-            
-            success = result.get('ok', False)
-            
-            if success:
-                logger.info(f"  → Execution SUCCESS: Edge {edge.edge_id} claimed")
-            else:
-                error = result.get('error', {}).get('message', 'Unknown error')
-                logger.info(f"  → Execution FAILED: {error}")
-            
-            return {
-                **state,
-                'execution_success': success,
-                'execution_response': result
-            }
-            
-        except Exception as e:
-            logger.error(f"  → Execution ERROR: {e}")
-            return {
-                **state,
-                'execution_success': False,
-                'execution_response': {'error': str(e)}
-            }
+        # Submit to server
+        if k == 1:
+            results = [_claim_result(claim)]
+        else:
+            futures = [self._pool.submit(claim) for _ in range(k)]
+            results = [_claim_result(f.result) for f in futures]
+        
+        success, result, outcomes = _collect_claims(results, edge.edge_id)
+        
+        return {
+            'execution_success': success,
+            'execution_response': result,
+            'execution_attempts': k,
+            'execution_outcomes': tuple(outcomes)
+        }
+    
+    def _num_attempts(self, state: AgentState) -> int:
+        """
+        Number of parallel claims for the selected edge.
+        
+        Uses k = ceil(log(1 - target) / log(1 - p_succ)) so that at least one
+        attempt succeeds with the target probability, capped by the configured
+        maximum, the affordable budget above reserve, and remaining retries.
+        Falls back to 1 without a simulation estimate.
+        """
+        max_k = self._max_parallel_attempts
+        p_succ = state['estimated_success_prob']
+        if max_k <= 1 or not self._enable_simulation or not 0.0 < p_succ < 1.0:
+            return 1
+        
+        k = math.ceil(math.log(1.0 - self._parallel_target_success) / math.log(1.0 - p_succ))
+        
+        affordable = (state['current_budget'] - self._min_reserve) // max(1, state['num_bell_pairs'])
+        attempts_so_far = state['attempt_history'].get(state['selected_edge'].edge_id, 0)
+        remaining_retries = self._max_retries_per_edge - attempts_so_far
+        
+        return max(1, min(k, max_k, affordable, remaining_retries))
+    
+    def close(self) -> None:
+        """Shut down the parallel claim pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+
+def _claim_result(claim: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Response of one claim attempt; an exception counts as a failed attempt."""
+    try:
+        return claim()
+    except Exception as e:
+        logger.error("  → Execution ERROR: %s", e)
+        return {'ok': False, 'error': {'code': 'EXCEPTION', 'message': str(e)}}
+
+
+def _collect_claims(
+    results: List[Dict[str, Any]],
+    edge_id: Tuple[str, str]
+) -> Tuple[bool, Dict[str, Any], List[bool]]:
+    """
+    Reduce the responses of a step's claim attempts to one outcome.
+    
+    Each response comes from _claim_result, so an attempt that raised is
+    a failure here and doesn't hide another that claimed the edge.
+    
+    Returns:
+        (success, response, outcomes); the first successful response wins,
+        otherwise the last failure is reported. outcomes holds each
+        attempt's ok flag in submission order.
+    """
+    if not results:
+        return False, {}, []
+    
+    outcomes = [r.get('ok', False) for r in results]
+    result = next((r for r, ok in zip(results, outcomes) if ok), results[-1])
+    success = any(outcomes)
+    
+    if success:
+        logger.info("  → Execution SUCCESS: Edge %s claimed (%d attempt(s))", edge_id, len(results))
+    else:
+        error = result.get('error', {}).get('message', 'Unknown error')
+        logger.info("  → Execution FAILED: %s (%d attempt(s))", error, len(results))
+    
+    return success, result, outcomes
+
+
+def _skip_risk_adjustment(current_budget: int, initial_budget: int) -> None:
+    """Risk adjuster used when adaptive_risk is off."""
 
 
 class UpdateStateNode:
@@ -420,79 +558,100 @@ class UpdateStateNode:
         self.budget_manager = budget_manager
         self.config = config
         self.client = client
+        self._min_reserve = config.min_reserve
+        # Resolve adaptive_risk once: either the real adjuster or a no-op
+        self._adjust_risk = (
+            budget_manager.adjust_risk_tolerance if config.adaptive_risk
+            else _skip_risk_adjustment
+        )
     
-    def __call__(self, state: AgentState) -> AgentState:
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Update state after execution."""
-        # Increment iteration
+        # Iteration number after the reducer adds this step (for logging)
         new_iteration = state['iteration'] + 1
         
         # Handle skipped attempts
         if state['action'] == 'skip':
-            logger.info(f"[Iteration {new_iteration}] Action: SKIP - {state.get('stop_reason', 'Unknown')}")
+            logger.info("[Iteration %d] Action: SKIP - %s", new_iteration, state.get('stop_reason', 'Unknown'))
             return {
-                **state,
-                'iteration': new_iteration,
+                'iteration': 1,
                 'action': 'continue'  # Try next edge
             }
         
-        # Prepare updated state
-        updates = {'iteration': new_iteration}
+        # EdgeSelection ran out of candidates: nothing was submitted, so the
+        # claimable set is unchanged and re-ranking would loop forever
+        if state['action'] == 'stop':
+            logger.info("[Iteration %d] Action: STOP - %s", new_iteration, state.get('stop_reason', 'Unknown'))
+            return {'iteration': 1}
         
-        # Update attempt history (need to create new dict to avoid mutation)
-        new_attempt_history = dict(state['attempt_history'])
+        # Prepare the partial update; counters are deltas for the add reducer,
+        # and keys not set here keep their current value in the graph state
+        updates = {'iteration': 1}
         
         if state['selected_edge']:
             edge_id = state['selected_edge'].edge_id
-            new_attempt_history[edge_id] = new_attempt_history.get(edge_id, 0) + 1
+            attempts = max(1, state.get('execution_attempts', 1))
             
-            # Record in budget manager
-            actual_cost = state['num_bell_pairs'] if state['execution_success'] else 0
-            self.budget_manager.record_attempt(
-                edge_id,
-                state['execution_success'],
-                actual_cost
-            )
+            # Update attempt history (copied; the incoming state is never mutated)
+            new_attempt_history = dict(state['attempt_history'])
+            new_attempt_history[edge_id] = new_attempt_history.get(edge_id, 0) + attempts
+            updates['attempt_history'] = new_attempt_history
             
-            # Update counters
-            if state['execution_success']:
-                updates['successful_claims'] = state['successful_claims'] + 1
+            # Per-attempt outcomes from ExecutionNode (one flag per attempt if absent)
+            success = state['execution_success']
+            outcomes = state.get('execution_outcomes') or [success] * attempts
+            
+            # The edge is gained at most once: the first ok response claims it,
+            # and further ok responses for the same edge are wasted attempts
+            # (the server still spent their pairs)
+            first_ok = outcomes.index(True) if success else -1
+            for i, ok in enumerate(outcomes):
+                self.budget_manager.record_attempt(
+                    edge_id,
+                    i == first_ok,
+                    state['num_bell_pairs'] if ok else 0
+                )
+            
+            # Update counters (one success per edge; every other attempt failed)
+            claimed = 1 if success else 0
+            if claimed:
+                updates['successful_claims'] = claimed
+            if len(outcomes) > claimed:
+                updates['failed_attempts'] = len(outcomes) - claimed
+            if success:
                 # Reset retry counter on success
                 self.budget_manager.reset_edge_attempts(edge_id)
-            else:
-                updates['failed_attempts'] = state['failed_attempts'] + 1
-        
-        updates['attempt_history'] = new_attempt_history
         
-        # Refresh game state from server
-        status = self.client.get_status()
+        # Refresh game state and claimable edges in one server round-trip
+        bundle = self.client.get_state_bundle()
+        status = bundle['status']
         updates['current_budget'] = status.get('budget', 0)
         updates['current_score'] = status.get('score', 0)
-        updates['owned_nodes'] = status.get('owned_nodes', [])
-        updates['owned_edges'] = status.get('owned_edges', [])
-        
-        # Refresh claimable edges
-        updates['claimable_edges'] = self.client.get_claimable_edges()
+        updates['owned_nodes'] = frozenset(status.get('owned_nodes', ()))
+        updates['owned_edges'] = frozenset(tuple(e) for e in status.get('owned_edges', ()))
+        updates['claimable_edges'] = bundle['claimable_edges']
+        updates['_claimables_version'] = state.get('_claimables_version', 0) + 1
+        updates['claimable_edges_soa'] = build_edge_arrays(
+            updates['claimable_edges'], state['graph'], updates['owned_nodes']
+        )
         
-        # Adaptive risk adjustment
-        if self.config.adaptive_risk:
-            self.budget_manager.adjust_risk_tolerance(
-                updates['current_budget'],
-                state['initial_budget']
-            )
+        # Adaptive risk adjustment (no-op when disabled)
+        self._adjust_risk(updates['current_budget'], state['initial_budget'])
         
         # Determine next action
-        if updates['current_budget'] <= self.config.min_reserve:
+        if updates['current_budget'] <= self._min_reserve:
             updates['action'] = 'stop'
-            updates['stop_reason'] = f"Budget at minimum reserve ({self.config.min_reserve})"
+            updates['stop_reason'] = f"Budget at minimum reserve ({self._min_reserve})"
         elif not updates['claimable_edges']:
             updates['action'] = 'stop'
             updates['stop_reason'] = "No more claimable edges"
         else:
             updates['action'] = 'continue'
         
-        logger.info(f"[Iteration {new_iteration}] State updated: Budget={updates['current_budget']}, Score={updates['current_score']}, Action={updates['action']}")
+        logger.info("[Iteration %d] State updated: Budget=%s, Score=%s, Action=%s",
+                    new_iteration, updates['current_budget'], updates['current_score'], updates['action'])
         
-        return {**state, **updates}
+        return updates
 
 
 # ============================================================================
@@ -523,6 +682,10 @@ class LangGraphQuantumAgent:
         self.client = client
         self.config = config or LangGraphAgentConfig()
         
+        # Topology is static for a game; fetch it once. Nodes only read it,
+        # so a read-only proxy is handed around without copies
+        self._graph_proxy = MappingProxyType(client.get_cached_graph())
+        
         # Initialize strategy components (reuse existing logic)
         self.edge_strategy = EdgeSelectionStrategy(
             utility_weight=self.config.utility_weight,
@@ -542,10 +705,36 @@ class LangGraphQuantumAgent:
         if self.config.enable_simulation:
             self.simulator = DistillationSimulator(shots=self.config.simulation_shots)
         else:
-            self.simulator = None
+            self.simulator = _NoOpSimulator()
+        
+        # Node instances shared by the LangGraph and the direct executor
+        self._nodes = self._build_nodes()
+        self._execution_node = self._nodes[4]
         
         # Build LangGraph
         self.graph = self._build_graph()
+        self._direct_step = self._build_direct_executor()
+    
+    def close(self) -> None:
+        """Release the ExecutionNode's claim threads (waits for in-flight claims)."""
+        self._execution_node.close()
+    
+    def __enter__(self) -> "LangGraphQuantumAgent":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _build_nodes(self) -> Tuple[Any, ...]:
+        """Create the decision nodes in execution order."""
+        return (
+            EdgeSelectionNode(self.edge_strategy, self.budget_manager),
+            ResourceAllocationNode(self.distillation_planner),
+            DistillationStrategyNode(self.config),
+            SimulationCheckNode(self.simulator),
+            ExecutionNode(self.client, self.config),
+            UpdateStateNode(self.budget_manager, self.config, self.client),
+        )
     
     def _build_graph(self) -> StateGraph:
         """
@@ -562,13 +751,8 @@ class LangGraphQuantumAgent:
         # Create state graph
         workflow = StateGraph(AgentState)
         
-        # Create node instances
-        edge_selection = EdgeSelectionNode(self.edge_strategy, self.budget_manager)
-        resource_allocation = ResourceAllocationNode(self.distillation_planner)
-        distillation_strategy = DistillationStrategyNode(self.config)
-        simulation_check = SimulationCheckNode(self.simulator)
-        execution = ExecutionNode(self.client)
-        update_state = UpdateStateNode(self.budget_manager, self.config, self.client)
+        (edge_selection, resource_allocation, distillation_strategy,
+         simulation_check, execution, update_state) = self._nodes
         
         # Add nodes to graph
         workflow.add_node("edge_selection", edge_selection)
@@ -598,6 +782,28 @@ class LangGraphQuantumAgent:
         
         return workflow.compile()
     
+    def _build_direct_executor(self):
+        """
+        Build a function that runs one loop iteration without Pregel.
+        
+        The graph is a straight chain with a single back-edge and no
+        checkpointer, so calling the nodes in order and merging each partial
+        update (through the AgentState reducers) gives the same result as
+        one pass through the graph.
+        The returned function updates the state dict it is given in place.
+        """
+        nodes = self._nodes
+        reducers = _STATE_REDUCERS
+        
+        def step(state: Dict[str, Any]) -> Dict[str, Any]:
+            for node in nodes:
+                for key, value in node(state).items():
+                    reducer = reducers.get(key)
+                    state[key] = reducer(state[key], value) if reducer else value
+            return state
+        
+        return step
+    
     def _should_continue(self, state: AgentState) -> str:
         """
         Routing function: Decide whether to continue or stop.
@@ -608,21 +814,30 @@ class LangGraphQuantumAgent:
         """
         return state['action']
     
+    def refresh_topology(self) -> None:
+        """Re-fetch the graph from the server (if the topology has changed)."""
+        self._graph_proxy = MappingProxyType(self.client.get_cached_graph(force=True))
+    
     def _initialize_state(self) -> AgentState:
         """Initialize agent state from game server."""
-        status = self.client.get_status()
-        graph = self.client.get_cached_graph()
-        claimable_edges = self.client.get_claimable_edges()
+        bundle = self.client.get_state_bundle()
+        status = bundle['status']
+        graph = self._graph_proxy
+        claimable_edges = bundle['claimable_edges']
         
         initial_budget = status.get('budget', 0)
+        owned_nodes = frozenset(status.get('owned_nodes', ()))
         
         return AgentState(
             # Game state
             current_budget=initial_budget,
             current_score=status.get('score', 0),
-            owned_nodes=status.get('owned_nodes', []),
-            owned_edges=status.get('owned_edges', []),
+            owned_nodes=owned_nodes,
+            owned_edges=frozenset(tuple(e) for e in status.get('owned_edges', ())),
             claimable_edges=claimable_edges,
+            claimable_edges_soa=build_edge_arrays(
+                claimable_edges, graph, owned_nodes
+            ),
             graph=graph,
             
             # Decision state (initialized to defaults)
@@ -641,6 +856,8 @@ class LangGraphQuantumAgent:
             # Execution results
             execution_success=False,
             execution_response={},
+            execution_attempts=0,
+            execution_outcomes=(),
             
             # History & control
             iteration=0,
@@ -651,7 +868,11 @@ class LangGraphQuantumAgent:
             
             # Control flow
             action="continue",
-            stop_reason=""
+            stop_reason="",
+            
+            # Selection cache
+            _claimables_version=0,
+            _ranked_cache=None
         )
     
     def run_iteration(self) -> Dict[str, Any]:
@@ -699,18 +920,29 @@ class LangGraphQuantumAgent:
         
         # Initialize state
         state = self._initialize_state()
-        
-        # Run until termination or max iterations
-        for i in range(max_iterations):
-            # Execute one step through the graph
-            state = self.graph.invoke(state)
-            
-            # Check termination
-            if state['action'] == 'stop':
-                if verbose:
-                    print(f"\nStopping: {state['stop_reason']}")
-                break
-        
+
+        if self.config.use_pregel:
+            # One run through the graph: the update_state → edge_selection edge
+            # does the looping, and the recursion limit caps it at max_iterations.
+            # Streaming values keeps the last full state if the cap is hit.
+            run_config = {'recursion_limit': max_iterations * _STEPS_PER_ITERATION + 1}
+            try:
+                for state in self.graph.stream(state, config=run_config, stream_mode="values"):
+                    pass
+            except GraphRecursionError:
+                state = {**state, 'action': 'stop', 'stop_reason': 'Max iterations reached'}
+        else:
+            state = dict(state)
+            for _ in range(max_iterations):
+                self._direct_step(state)
+                if state['action'] == 'stop':
+                    break
+            else:
+                state.update(action='stop', stop_reason='Max iterations reached')
+
+        if verbose and state['action'] == 'stop':
+            print(f"\nStopping: {state['stop_reason']}")
+
         # Final summary
         summary = {
             'iterations': state['iteration'],
@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 from core.client import GameClient
 from agentic.langgraph_deterministic_agent import (
@@ -47,12 +48,15 @@ def main():
     
     args = parser.parse_args()
     
+    # Node-level decision logs are INFO; show them only when asked
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    
     print("=" * 70)
     print("LangGraph Quantum Network Agent")
     print("=" * 70)
     
-    # Create client
-    client = GameClient()
+    # Create client (graph cached on disk across runs)
+    client = GameClient(disk_cache=True)
     
     # Register player
     print(f"\nRegistering player: {args.player_id} ({args.name})")
@@ -89,7 +93,7 @@ def main():
         print(f"\nUsing existing starting node: {status.get('starting_node')}")
     
     # Print initial status
-    client.print_status()
+    client.print_status(verbose=args.verbose)
     
     # Create agent based on strategy
     print(f"\nCreating agent with '{args.strategy}' strategy...")
@@ -108,8 +112,11 @@ def main():
         agent.config.max_retries_per_edge = args.max_retries
     if args.no_simulation:
         agent.config.enable_simulation = False
-        agent.simulator = None
-    
+    if args.min_reserve is not None or args.max_retries is not None or args.no_simulation:
+        # Nodes bind config values when the graph is built; rebuild with the overrides
+        agent.close()
+        agent = LangGraphQuantumAgent(client, agent.config)
+
     print("✓ Agent created")
     print(f"  Min reserve: {agent.config.min_reserve}")
     print(f"  Max retries: {agent.config.max_retries_per_edge}")
@@ -150,6 +157,9 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    
+    finally:
+        agent.close()
 
 
 if __name__ == "__main__":
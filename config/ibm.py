@@ -0,0 +1,62 @@
+"""
+IBM Quantum settings, loaded on first use.
+
+Nothing is read at import time; get_ibm_config() resolves the settings once
+and caches them, so scripts that never touch IBM hardware pay nothing.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True, slots=True)
+class IBMConfig:
+    """IBM Quantum account and execution settings."""
+    token: str
+    hub: str = "ibm-q"
+    group: str = "open"
+    project: str = "main"
+    default_shots: int = 4096
+    use_real_hardware: bool = False
+    min_qubits: int = 5
+
+
+@lru_cache(maxsize=None)
+def get_ibm_config() -> IBMConfig:
+    """
+    Load IBM Quantum settings.
+
+    Uses config/ibm_config.py (a local, uncommitted copy of
+    ibm_config_template.py) when it exists and sets a token; otherwise the
+    environment: IBM_API_TOKEN (or IBM_QUANTUM_TOKEN), IBM_HUB, IBM_GROUP,
+    IBM_PROJECT.
+
+    Raises:
+        RuntimeError: If no API token is configured
+    """
+    try:
+        from config import ibm_config as local
+    except ImportError:
+        local = None
+
+    if local is not None and getattr(local, "IBM_API_TOKEN", ""):
+        return IBMConfig(
+            token=local.IBM_API_TOKEN,
+            hub=getattr(local, "IBM_HUB", "ibm-q"),
+            group=getattr(local, "IBM_GROUP", "open"),
+            project=getattr(local, "IBM_PROJECT", "main"),
+            default_shots=getattr(local, "DEFAULT_SHOTS", 4096),
+            use_real_hardware=getattr(local, "USE_REAL_HARDWARE", False),
+            min_qubits=getattr(local, "MIN_QUBITS", 5),
+        )
+
+    token = os.environ.get("IBM_API_TOKEN") or os.environ.get("IBM_QUANTUM_TOKEN")
+    if not token:
+        raise RuntimeError("No IBM Quantum token: create config/ibm_config.py or set IBM_API_TOKEN")
+    return IBMConfig(
+        token=token,
+        hub=os.environ.get("IBM_HUB", "ibm-q"),
+        group=os.environ.get("IBM_GROUP", "open"),
+        project=os.environ.get("IBM_PROJECT", "main"),
+    )
@@ -1,7 +1,9 @@
 """
 IBM Quantum Configuration Template
 
-Copy this file to 'ibm_config.py' and add your API token.
+Copy this file to 'ibm_config.py' and add your API token, or leave the
+token empty and export IBM_API_TOKEN instead. Settings are read through
+config.ibm.get_ibm_config().
 
 To get your API token:
 1. Go to https://quantum.ibm.com/account
@@ -13,7 +15,7 @@ IMPORTANT: Never commit ibm_config.py to git!
 
 # IBM Quantum API Token
 # Get yours from: https://quantum.ibm.com/account
-IBM_API_TOKEN = "QQ5jnejkbzeJDKr_dXvghu-jfAin88S2hRCQAMCxEG1x"
+IBM_API_TOKEN = ""
 
 # IBM Quantum Hub/Group/Project
 # Default is the free tier
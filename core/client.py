@@ -5,12 +5,72 @@ Handles player registration, edge claiming, and status queries. The server
 provides a REST API that returns game state (graph, budget, score) and accepts
 circuit submissions for edge claims.
 
-Graph data is cached since it doesn't change during gameplay.
+Graph data is cached since it doesn't change during gameplay, in memory and,
+with disk_cache=True, on disk across runs (revalidated with ETag, or a short
+TTL). Requests go
+through a pooled keep-alive session that is safe to share between the
+threads agents use for concurrent claims.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
 import requests
-from qiskit import QuantumCircuit, qasm3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Qiskit is only needed to serialize circuits for claims; importing it costs
+# hundreds of ms, so status/graph-only scripts never load it
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# Faster (de)serialization of graph/status payloads when available
+try:
+    import orjson
+    HAS_ORJSON = True
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+# Serialized circuits kept per client (protocols x pair counts in use)
+_QASM_CACHE_SIZE = 16
+
+# On-disk graph cache; without an ETag from the server the copy is trusted for this long
+GRAPH_CACHE_FILE = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "faqnp" / "graph.json"
+GRAPH_CACHE_TTL = 600  # seconds
+
+# How old a status may be when a caller passes get_status(fresh=False)
+STATUS_TTL = 0.5  # seconds
+
+
+def build_status_report(status: Dict[str, Any], claimable: List[Dict[str, Any]]) -> str:
+    """Format an already-fetched status and its claimable edges for display (no I/O)."""
+    owned_nodes = status.get('owned_nodes', [])
+    owned_edges = status.get('owned_edges', [])
+    lines = [
+        "=" * 50,
+        f"Player: {status.get('player_id', 'Unknown')} ({status.get('name', '')})",
+        f"Score: {status.get('score', 0)} | Budget: {status.get('budget', 0)} bell pairs",
+        f"Active: {'Yes' if status.get('is_active', False) else 'No'}",
+        f"Starting node: {status.get('starting_node', 'Not selected')}",
+        f"Owned: {len(owned_nodes)} nodes, {len(owned_edges)} edges",
+        f"Claimable edges: {len(claimable)}",
+    ]
+    for edge in claimable[:3]:
+        lines.append(f"  - {edge['edge_id']}: threshold={edge['base_threshold']:.2f}, difficulty={edge['difficulty_rating']}")
+    if len(claimable) > 3:
+        lines.append(f"  ... and {len(claimable) - 3} more")
+    lines.append("=" * 50)
+    return "\n".join(lines)
 
 
 class GameClient:
@@ -22,48 +82,101 @@ class GameClient:
     so agents can decide how to respond to failures.
     """
 
-    def __init__(self, base_url: str = "https://demo-entanglement-distillation-qfhvrahfcq-uc.a.run.app", api_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "https://demo-entanglement-distillation-qfhvrahfcq-uc.a.run.app",
+        api_token: Optional[str] = None,
+        disk_cache: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
+        self.disk_cache = disk_cache
         self.player_id: Optional[str] = None
         self.name: Optional[str] = None
         self._cached_graph: Optional[Dict[str, Any]] = None
+        # Lookup indexes over the cached graph (rebuilt whenever it is fetched)
+        self._node_index: Dict[str, Dict[str, Any]] = {}
+        self._edge_index: Dict[FrozenSet[str], Dict[str, Any]] = {}
+        # Dense node positions and per-edge endpoint positions for the owned-mask XOR
+        self._node_pos: Dict[str, int] = {}
+        self._edge_src = np.empty(0, dtype=np.int32)
+        self._edge_dst = np.empty(0, dtype=np.int32)
+        # Last status and when it was fetched (monotonic); dropped on every POST
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_ts = 0.0
+        # Cleared when the server rejects protocol-only claims (claim_edge_by_protocol)
+        self._protocol_claims_supported = True
+        # id(circuit) -> (circuit, qasm); the circuit is held so its id can't be reused
+        self._qasm_cache: Dict[int, Tuple["QuantumCircuit", str]] = {}
+
+        # Keep-alive connection pool shared by all requests (and threads).
+        # Gateway errors are retried with backoff inside urllib3; POSTs are
+        # not retried (claims aren't idempotent)
+        self._session = requests.Session()
+        retry = Retry(total=5, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def api_token(self) -> Optional[str]:
+        return self._api_token
+
+    @api_token.setter
+    def api_token(self, token: Optional[str]):
+        self._api_token = token
+        # Shared by every request, so only rebuilt when the token changes
+        self._request_headers = {"Content-Type": "application/json"}
+        if token:
+            self._request_headers["Authorization"] = f"Bearer {token}"
 
     def _headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-        return headers
+        """Request headers (shared dict; copy before modifying)."""
+        return self._request_headers
 
     def _get(self, path: str) -> Dict[str, Any]:
         """GET with timeout and error dict return (no exceptions)."""
+        return self._get_conditional(path)[0]
+
+    def _get_conditional(self, path: str, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        GET with optional If-None-Match.
+
+        Returns:
+            (data, etag); data is None when the server answers 304 Not Modified.
+        """
+        headers = {**self._headers(), "If-None-Match": etag} if etag else self._headers()
         try:
-            r = requests.get(f"{self.base_url}{path}", headers=self._headers(), timeout=120)
-            r.raise_for_status()
-            return r.json().get("data", {})
+            r = self._session.get(f"{self.base_url}{path}", headers=headers, timeout=120)
+            if r.status_code == 304:
+                return None, etag
+            if r.status_code >= 400:
+                return {"error": f"HTTP error: {r.status_code}"}, None
+            return _loads(r.content).get("data", {}), r.headers.get("ETag")
         except requests.Timeout:
-            return {"error": "Request timeout"}
+            return {"error": "Request timeout"}, None
         except requests.ConnectionError:
-            return {"error": "Connection failed"}
-        except requests.HTTPError as e:
-            return {"error": f"HTTP error: {e.response.status_code}"}
+            return {"error": "Connection failed"}, None
         except Exception as e:
-            return {"error": f"Request failed: {str(e)}"}
+            return {"error": f"Request failed: {str(e)}"}, None
 
     def _post(self, path: str, payload: Dict[str, Any], require_auth: bool = True) -> Dict[str, Any]:
         """POST with auth check and error dict return."""
         if require_auth and not self.api_token:
             return {"ok": False, "error": {"code": "NO_TOKEN", "message": "No API token. Register first."}}
+        # Any write may change budget/ownership
+        self._status_cache = None
         try:
-            r = requests.post(f"{self.base_url}{path}", json=payload, headers=self._headers(), timeout=30)
-            r.raise_for_status()
-            return r.json()
+            r = self._session.post(f"{self.base_url}{path}", data=_dumps(payload), headers=self._headers(), timeout=30)
+            if r.status_code == 429:
+                return {"ok": False, "error": {"code": "RATE_LIMITED", "message": "HTTP 429"}}
+            if r.status_code >= 400:
+                return {"ok": False, "error": {"code": "HTTP_ERROR", "message": f"HTTP {r.status_code}"}}
+            return _loads(r.content)
         except requests.Timeout:
             return {"ok": False, "error": {"code": "TIMEOUT", "message": "Request timeout"}}
         except requests.ConnectionError:
             return {"ok": False, "error": {"code": "CONNECTION_ERROR", "message": "Connection failed"}}
-        except requests.HTTPError as e:
-            return {"ok": False, "error": {"code": "HTTP_ERROR", "message": f"HTTP {e.response.status_code}"}}
         except Exception as e:
             return {"ok": False, "error": {"code": "REQUEST_FAILED", "message": str(e)}}
 
@@ -94,15 +207,70 @@ class GameClient:
             return {"ok": False, "error": {"code": "NOT_REGISTERED", "message": "Not registered"}}
         return self._post("/v1/restart", {"player_id": self.player_id})
 
-    def get_status(self) -> Dict[str, Any]:
-        """Get current player status including score, budget, owned nodes/edges."""
+    def get_status(self, fresh: bool = True) -> Dict[str, Any]:
+        """
+        Get current player status including score, budget, owned nodes/edges.
+
+        Args:
+            fresh: If False, reuse a status fetched within STATUS_TTL seconds
+                (and not invalidated by a claim or other POST since)
+        """
         if not self.player_id:
             return {}
-        return self._get(f"/v1/status/{self.player_id}")
+        if not fresh and self._status_cache is not None and time.monotonic() - self._status_ts < STATUS_TTL:
+            return self._status_cache
+
+        status = self._get(f"/v1/status/{self.player_id}")
+        if "error" not in status:
+            self._status_cache = status
+            self._status_ts = time.monotonic()
+        return status
 
     def get_graph(self) -> Dict[str, Any]:
-        """Get the quantum network graph structure."""
-        return self._get("/v1/graph")
+        """
+        Get the quantum network graph structure.
+
+        With disk_cache on (opt-in), the last graph from this server is kept
+        on disk: it is revalidated with If-None-Match when the server sent an
+        ETag, otherwise reused for GRAPH_CACHE_TTL seconds without a request.
+        If revalidation fails (timeout, 5xx), the cached graph is returned.
+        """
+        if not self.disk_cache:
+            return self._get("/v1/graph")
+
+        entry = self._load_graph_cache()
+        if entry and not entry.get("etag") and time.time() - entry["saved_at"] < GRAPH_CACHE_TTL:
+            return entry["graph"]
+
+        data, etag = self._get_conditional("/v1/graph", entry.get("etag") if entry else None)
+        if data is None:
+            return entry["graph"]
+        if "error" in data:
+            # Server unreachable or failing: the graph on disk is still valid
+            return entry["graph"] if entry else data
+        self._save_graph_cache(data, etag)
+        return data
+
+    def _load_graph_cache(self) -> Optional[Dict[str, Any]]:
+        """Cached graph entry for this server, or None."""
+        try:
+            with open(GRAPH_CACHE_FILE, "rb") as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("base_url") == self.base_url else None
+
+    def _save_graph_cache(self, graph: Dict[str, Any], etag: Optional[str]):
+        """Best-effort write of the graph cache (ignored if the directory isn't writable)."""
+        entry = {"base_url": self.base_url, "etag": etag, "saved_at": time.time(), "graph": graph}
+        try:
+            GRAPH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = GRAPH_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(_dumps(entry))
+            os.replace(tmp, GRAPH_CACHE_FILE)
+        except OSError:
+            pass
 
     def get_leaderboard(self) -> List[Dict[str, Any]]:
         """Get the current leaderboard."""
@@ -111,9 +279,10 @@ class GameClient:
     def claim_edge(
         self,
         edge: Tuple[str, str],
-        circuit: QuantumCircuit,
+        circuit: "QuantumCircuit",
         flag_bit: int,
         num_bell_pairs: int,
+        circuit_qasm: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Claim an edge by submitting a distillation circuit.
@@ -123,21 +292,95 @@ class GameClient:
             circuit: 2N-qubit QuantumCircuit with LOCC operations
             flag_bit: Classical bit index for post-selection (0 = success)
             num_bell_pairs: Number of raw Bell pairs (1-8)
+            circuit_qasm: Pre-serialized QASM3 for circuit (skips serialization)
 
         Returns:
             Response with fidelity, success_probability, threshold, and success status.
         """
+        if not self.player_id:
+            return {"ok": False, "error": {"code": "NOT_REGISTERED", "message": "Not registered"}}
+        payload = self._claim_payload(edge, circuit, flag_bit, num_bell_pairs, circuit_qasm)
+        return self._post("/v1/claim_edge", payload)
+
+    def claim_edge_by_protocol(
+        self,
+        edge: Tuple[str, str],
+        protocol: str,
+        num_bell_pairs: int,
+    ) -> Dict[str, Any]:
+        """
+        Claim an edge by naming a standard protocol instead of uploading QASM.
+
+        The server rebuilds the (deterministic) circuit for the protocol and
+        pair count, so no circuit is serialized client-side. If the server
+        answers UNSUPPORTED_PROTOCOL, this falls back to building the circuit
+        locally and calling claim_edge(), and remembers the fallback for
+        later calls.
+
+        Args:
+            edge: Tuple of (node_a, node_b)
+            protocol: "bbpssw" or "dejmps"
+            num_bell_pairs: Number of raw Bell pairs (2-8)
+
+        Returns:
+            Same response as claim_edge().
+        """
         if not self.player_id:
             return {"ok": False, "error": {"code": "NOT_REGISTERED", "message": "Not registered"}}
 
-        payload = {
+        if self._protocol_claims_supported:
+            resp = self._post("/v1/claim_edge", {
+                "player_id": self.player_id,
+                "edge": [edge[0], edge[1]],
+                "num_bell_pairs": int(num_bell_pairs),
+                "protocol": protocol,
+            })
+            # Only an explicit UNSUPPORTED_PROTOCOL means the server lacks the
+            # feature; any other error (including HTTP 400/422) is a real
+            # rejection of this claim and must not be resubmitted
+            if resp.get("error", {}).get("code") != "UNSUPPORTED_PROTOCOL":
+                return resp
+            self._protocol_claims_supported = False
+
+        from distillation.distillation import get_circuit_template
+        circuit, flag_bit = get_circuit_template(protocol, int(num_bell_pairs))
+        return self.claim_edge(edge, circuit, flag_bit, num_bell_pairs)
+
+    def _claim_payload(
+        self,
+        edge: Tuple[str, str],
+        circuit: "QuantumCircuit",
+        flag_bit: int,
+        num_bell_pairs: int,
+        circuit_qasm: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return {
             "player_id": self.player_id,
             "edge": [edge[0], edge[1]],
             "num_bell_pairs": int(num_bell_pairs),
-            "circuit_qasm": qasm3.dumps(circuit),
+            "circuit_qasm": circuit_qasm if circuit_qasm is not None else self._qasm(circuit),
             "flag_bit": int(flag_bit),
         }
-        return self._post("/v1/claim_edge", payload)
+
+    def _qasm(self, circuit: "QuantumCircuit") -> str:
+        """
+        QASM3 text for a circuit, memoized per circuit object.
+
+        Both agents claim with the shared templates from
+        get_circuit_template(), one object per (protocol, num_bell_pairs),
+        so repeated claims skip re-serialization. Circuits must not be
+        mutated after they have been submitted.
+        """
+        entry = self._qasm_cache.get(id(circuit))
+        if entry is not None and entry[0] is circuit:
+            return entry[1]
+
+        from qiskit import qasm3
+        qasm = qasm3.dumps(circuit)
+        if len(self._qasm_cache) >= _QASM_CACHE_SIZE:
+            self._qasm_cache.pop(next(iter(self._qasm_cache), None), None)
+        self._qasm_cache[id(circuit)] = (circuit, qasm)
+        return qasm
 
     # ---- Convenience Methods ----
 
@@ -145,61 +388,84 @@ class GameClient:
         """Get graph with caching (graph doesn't change during game)."""
         if force or self._cached_graph is None:
             self._cached_graph = self.get_graph()
+            self._build_indexes(self._cached_graph)
         return self._cached_graph
 
-    def get_claimable_edges(self) -> List[Dict[str, Any]]:
-        """Get edges adjacent to owned nodes that can be claimed."""
+    def _build_indexes(self, graph: Dict[str, Any]):
+        """Index nodes by id, edges by endpoint pair, and edge endpoints by node position."""
+        self._node_index = {node['node_id']: node for node in graph.get('nodes', [])}
+        self._node_pos = {node_id: i for i, node_id in enumerate(self._node_index)}
+        edges = graph.get('edges', [])
+        self._edge_index = {}
+        src = np.empty(len(edges), dtype=np.int32)
+        dst = np.empty(len(edges), dtype=np.int32)
+        for i, edge in enumerate(edges):
+            n1, n2 = edge['edge_id']
+            self._edge_index[frozenset((n1, n2))] = edge
+            # Endpoints missing from the node list get their own positions
+            src[i] = self._node_pos.setdefault(n1, len(self._node_pos))
+            dst[i] = self._node_pos.setdefault(n2, len(self._node_pos))
+        self._edge_src = src
+        self._edge_dst = dst
+
+    def get_claimable_edges(self, status: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Get edges adjacent to owned nodes that can be claimed.
+
+        Args:
+            status: Status the caller already fetched (avoids another request)
+        """
+        if status is None:
+            status = self.get_status()
+        return self._claimable_from_status(status)
+
+    def get_state_bundle(self) -> Dict[str, Any]:
+        """
+        Get status and claimable edges with a single server round-trip.
+
+        Claimable edges are derived locally from the cached graph and the
+        fetched status, so this costs one status request instead of two.
+        """
         status = self.get_status()
-        owned = set(status.get('owned_nodes', []))
+        return {'status': status, 'claimable_edges': self._claimable_from_status(status)}
+
+    def _claimable_from_status(self, status: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Edges with exactly one endpoint in the status' owned nodes.
+
+        Results keep the graph's edge order.
+        """
+        owned = status.get('owned_nodes', [])
         if not owned:
             return []
 
-        graph = self.get_cached_graph()
-        claimable = []
-        for edge in graph.get('edges', []):
-            n1, n2 = edge['edge_id']
-            if (n1 in owned) != (n2 in owned):
-                claimable.append(edge)
-        return claimable
+        edges = self.get_cached_graph().get('edges', [])
+        owned_mask = np.zeros(len(self._node_pos), dtype=bool)
+        owned_mask[[self._node_pos[n] for n in owned if n in self._node_pos]] = True
+        idx = np.flatnonzero(owned_mask[self._edge_src] ^ owned_mask[self._edge_dst])
+        return [edges[i] for i in idx]
 
     def get_node_info(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific node."""
-        graph = self.get_cached_graph()
-        for node in graph.get('nodes', []):
-            if node['node_id'] == node_id:
-                return node
-        return None
+        self.get_cached_graph()
+        return self._node_index.get(node_id)
 
     def get_edge_info(self, node_a: str, node_b: str) -> Optional[Dict[str, Any]]:
-        """Get information about a specific edge."""
-        graph = self.get_cached_graph()
-        edge_id = tuple(sorted([node_a, node_b]))
-        for edge in graph.get('edges', []):
-            if tuple(sorted(edge['edge_id'])) == edge_id:
-                return edge
-        return None
-
-    def print_status(self):
-        """Print a formatted summary of player status."""
-        status = self.get_status()
+        """Get information about a specific edge (either endpoint order)."""
+        self.get_cached_graph()
+        return self._edge_index.get(frozenset((node_a, node_b)))
+
+    def print_status(self, verbose: bool = True):
+        """
+        Print a formatted summary of player status.
+
+        Args:
+            verbose: If False, return immediately without fetching or formatting
+        """
+        if not verbose:
+            return
+        status = self.get_status(fresh=False)
         if not status:
             print("Not registered or no status available.")
             return
-
-        print("=" * 50)
-        print(f"Player: {status.get('player_id', 'Unknown')} ({status.get('name', '')})")
-        print(f"Score: {status.get('score', 0)} | Budget: {status.get('budget', 0)} bell pairs")
-        print(f"Active: {'Yes' if status.get('is_active', False) else 'No'}")
-        print(f"Starting node: {status.get('starting_node', 'Not selected')}")
-
-        owned_nodes = status.get('owned_nodes', [])
-        owned_edges = status.get('owned_edges', [])
-        print(f"Owned: {len(owned_nodes)} nodes, {len(owned_edges)} edges")
-
-        claimable = self.get_claimable_edges()
-        print(f"Claimable edges: {len(claimable)}")
-        for edge in claimable[:3]:
-            print(f"  - {edge['edge_id']}: threshold={edge['base_threshold']:.2f}, difficulty={edge['difficulty_rating']}")
-        if len(claimable) > 3:
-            print(f"  ... and {len(claimable) - 3} more")
-        print("=" * 50)
+        print(build_status_report(status, self.get_claimable_edges(status)))
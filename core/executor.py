@@ -6,7 +6,7 @@ Provides high-level interface for running the quantum network optimization agent
 Supports both legacy agent (agent.py) and new LangGraph agent (langgraph_deterministic_agent.py).
 """
 
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, List, Literal
 from core.client import GameClient
 
 # Legacy agent
@@ -32,6 +32,42 @@ except ImportError:
     HAS_LANGGRAPH = False
 
 
+# (utility_weight, bonus_weight) per starting-node strategy
+_STARTING_NODE_WEIGHTS = {
+    "utility": (1.0, 0.0),
+    "bonus": (0.0, 1.0),
+    "balanced": (1.0, 0.5),
+}
+
+
+def build_leaderboard_report(
+    leaderboard: List[Dict[str, Any]],
+    player_id: Optional[str] = None,
+    top_n: int = 10
+) -> str:
+    """Format leaderboard entries as one table string (written with a single print)."""
+    lines = [
+        "",
+        "=" * 60,
+        "LEADERBOARD",
+        "=" * 60,
+        f"{'Rank':<6} {'Player':<20} {'Score':<10} {'Nodes':<8}",
+        "-" * 60,
+    ]
+    for i, entry in enumerate(leaderboard[:top_n], 1):
+        player = entry.get('player_id', 'Unknown')
+        score = entry.get('score', 0)
+        nodes = entry.get('owned_nodes', 0)
+        
+        # Highlight our player
+        if player == player_id:
+            lines.append(f"{'→ ' + str(i):<6} {player:<20} {score:<10} {nodes:<8} ← YOU")
+        else:
+            lines.append(f"{i:<6} {player:<20} {score:<10} {nodes:<8}")
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
 class GameExecutor:
     """
     High-level executor for the quantum networking game.
@@ -48,7 +84,8 @@ class GameExecutor:
         player_id: str,
         name: str,
         location: str = "remote",
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        client: Optional[GameClient] = None
     ):
         """
         Initialize executor.
@@ -58,18 +95,33 @@ class GameExecutor:
             name: Player name
             location: "in_person" or "remote"
             base_url: Optional custom server URL
+            client: Existing client to reuse (keeps its connection pool and caches)
         """
         self.player_id = player_id
         self.name = name
         self.location = location
         
-        # Create client
-        if base_url:
+        # Create client (restart() keeps it, so its pooled connections stay open)
+        if client is not None:
+            self.client = client
+        elif base_url:
             self.client = GameClient(base_url=base_url)
         else:
             self.client = GameClient()
         
         self.agent: Optional[QuantumNetworkAgent] = None
+        
+        # node_id -> node info, shared by register() and auto-selection
+        self._node_info_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def _node_info(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Node info, fetched once per session (failed lookups are retried)."""
+        node_info = self._node_info_cache.get(node_id)
+        if node_info is None:
+            node_info = self.client.get_node_info(node_id)
+            if node_info:
+                self._node_info_cache[node_id] = node_info
+        return node_info
     
     def register(self) -> Dict[str, Any]:
         """
@@ -89,7 +141,7 @@ class GameExecutor:
                 candidates = result['data']['starting_node_candidates']
                 print(f"\nStarting node candidates: {len(candidates)}")
                 for node_id in candidates:
-                    node_info = self.client.get_node_info(node_id)
+                    node_info = self._node_info(node_id)
                     if node_info:
                         utility = node_info.get('utility_qubits', 0)
                         bonus = node_info.get('bonus_bell_pairs', 0)
@@ -103,7 +155,8 @@ class GameExecutor:
     def select_starting_node(
         self,
         node_id: Optional[str] = None,
-        strategy: str = "balanced"
+        strategy: str = "balanced",
+        status: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Select starting node.
@@ -111,13 +164,14 @@ class GameExecutor:
         Args:
             node_id: Specific node ID, or None to auto-select
             strategy: "balanced", "utility", or "bonus" (if auto-selecting)
+            status: Player status already fetched by the caller (if auto-selecting)
             
         Returns:
             Selection response
         """
         if node_id is None:
             # Auto-select based on strategy
-            node_id = self._auto_select_starting_node(strategy)
+            node_id = self._auto_select_starting_node(strategy, status)
             if node_id is None:
                 return {'ok': False, 'error': 'No starting node candidates available'}
         
@@ -133,47 +187,44 @@ class GameExecutor:
         
         return result
     
-    def _auto_select_starting_node(self, strategy: str) -> Optional[str]:
+    def _auto_select_starting_node(
+        self,
+        strategy: str,
+        status: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Automatically select best starting node based on strategy.
         
         Args:
             strategy: "balanced", "utility", or "bonus"
+            status: Player status to read candidates from (fetched if None)
             
         Returns:
             Selected node ID or None
         """
-        status = self.client.get_status()
+        if status is None:
+            status = self.client.get_status()
         candidates = status.get('starting_node_candidates', [])
         
         if not candidates:
             return None
         
-        # Score each candidate
-        best_node = None
-        best_score = -1
-        
+        # Score each candidate: weighted utility qubits and bonus bell pairs
+        utility_weight, bonus_weight = _STARTING_NODE_WEIGHTS.get(
+            strategy, _STARTING_NODE_WEIGHTS["balanced"]
+        )
+        scored = []
         for node_id in candidates:
-            node_info = self.client.get_node_info(node_id)
-            if not node_info:
-                continue
-            
-            utility = node_info.get('utility_qubits', 0)
-            bonus = node_info.get('bonus_bell_pairs', 0)
-            
-            # Calculate score based on strategy
-            if strategy == "utility":
-                score = utility
-            elif strategy == "bonus":
-                score = bonus
-            else:  # balanced
-                score = utility + bonus * 0.5
-            
-            if score > best_score:
-                best_score = score
-                best_node = node_id
+            node_info = self._node_info(node_id)
+            if node_info:
+                score = (utility_weight * node_info.get('utility_qubits', 0)
+                         + bonus_weight * node_info.get('bonus_bell_pairs', 0))
+                scored.append((score, node_id))
         
-        return best_node
+        if not scored:
+            return None
+        # max() keeps the first of equal scores, like the old strict > scan
+        return max(scored, key=lambda item: item[0])[1]
     
     def create_agent(
         self,
@@ -192,6 +243,8 @@ class GameExecutor:
         Returns:
             Configured agent (QuantumNetworkAgent or LangGraphQuantumAgent)
         """
+        self._close_agent()
+        
         if use_langgraph:
             if not HAS_LANGGRAPH:
                 raise ImportError("LangGraph not installed. Run: pip install langgraph langchain-core")
@@ -210,6 +263,7 @@ class GameExecutor:
                         enable_simulation=config.enable_simulation,
                         simulation_shots=config.simulation_shots,
                         prefer_dejmps=config.prefer_dejmps,
+                        claim_by_protocol=config.claim_by_protocol,
                         adaptive_risk=config.adaptive_risk,
                         adaptive_pairs=config.adaptive_pairs
                     )
@@ -265,19 +319,19 @@ class GameExecutor:
         Returns:
             Execution summary
         """
-        # Check if already registered
+        # Check if already registered (one status fetch, reused below)
         status = self.client.get_status()
         if not status:
             # Register
             reg_result = self.register()
             if not reg_result.get('ok'):
                 return {'success': False, 'error': 'Registration failed'}
+            status = self.client.get_status()
         
         # Check if starting node selected
-        status = self.client.get_status()
         if not status.get('starting_node'):
             # Select starting node
-            select_result = self.select_starting_node(strategy="balanced")
+            select_result = self.select_starting_node(strategy="balanced", status=status)
             if not select_result.get('ok'):
                 return {'success': False, 'error': 'Starting node selection failed'}
         
@@ -307,25 +361,7 @@ class GameExecutor:
             top_n: Number of top players to show
         """
         leaderboard = self.client.get_leaderboard()
-        
-        print("\n" + "=" * 60)
-        print("LEADERBOARD")
-        print("=" * 60)
-        print(f"{'Rank':<6} {'Player':<20} {'Score':<10} {'Nodes':<8}")
-        print("-" * 60)
-        
-        for i, entry in enumerate(leaderboard[:top_n], 1):
-            player = entry.get('player_id', 'Unknown')
-            score = entry.get('score', 0)
-            nodes = entry.get('owned_nodes', 0)
-            
-            # Highlight our player
-            if player == self.player_id:
-                print(f"{'→ ' + str(i):<6} {player:<20} {score:<10} {nodes:<8} ← YOU")
-            else:
-                print(f"{i:<6} {player:<20} {score:<10} {nodes:<8}")
-        
-        print("=" * 60)
+        print(build_leaderboard_report(leaderboard, self.player_id, top_n))
     
     def restart(self):
         """Restart game (reset progress)."""
@@ -334,12 +370,20 @@ class GameExecutor:
         
         if result.get('ok'):
             print("✓ Game restarted")
-            self.agent = None  # Reset agent
+            # Reset agent
+            self._close_agent()
+            self._node_info_cache = {}
         else:
             error = result.get('error', {})
             print(f"✗ Restart failed: {error.get('message', 'Unknown error')}")
         
         return result
+    
+    def _close_agent(self):
+        """Release the current agent's claim threads before it is replaced."""
+        if self.agent is not None:
+            self.agent.close()
+            self.agent = None
 
 
 def quick_start(
@@ -347,7 +391,8 @@ def quick_start(
     name: str,
     location: str = "remote",
     agent_type: str = "default",
-    max_iterations: int = 100
+    max_iterations: int = 100,
+    client: Optional[GameClient] = None
 ) -> Dict[str, Any]:
     """
     Quick start function for immediate execution.
@@ -358,11 +403,12 @@ def quick_start(
         location: "in_person" or "remote"
         agent_type: "default", "aggressive", or "conservative"
         max_iterations: Maximum iterations
+        client: Existing client to reuse across runs (avoids new connections)
         
     Returns:
         Execution summary
     """
-    executor = GameExecutor(player_id, name, location)
+    executor = GameExecutor(player_id, name, location, client=client)
     return executor.run(agent_type=agent_type, max_iterations=max_iterations)
 
 
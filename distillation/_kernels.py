@@ -0,0 +1,49 @@
+"""
+Compiled scalar kernels for the distillation estimates.
+
+Uses numba when installed (compiled once and cached on disk); otherwise the
+same functions run as plain Python. distillation.py imports this module on
+first use so scripts that never estimate don't pay the numba import.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _bbpssw_output_fidelity(fidelity, rounds):
+    """Apply the BBPSSW Werner-state recurrence `rounds` times."""
+    for _ in range(rounds):
+        error = (1 - fidelity) / 3
+        p_succ = fidelity**2 + 2 * fidelity * error + 5 * error**2
+        fidelity = (fidelity**2 + error**2) / p_succ
+    return fidelity
+
+
+def _dejmps_output_fidelity(fidelity, rounds):
+    """Apply the DEJMPS Bell-diagonal recurrence `rounds` times, from Werner input."""
+    a = fidelity
+    b = c = d = (1 - fidelity) / 3
+    for _ in range(rounds):
+        norm = (a + b)**2 + (c + d)**2
+        a, b, c, d = (a*a + b*b) / norm, 2*c*d / norm, (c*c + d*d) / norm, 2*a*b / norm
+    return a
+
+
+def _success_probability(num_measurements, per_ancilla_success):
+    """Independent per-measurement pass rate, clamped to [0.1, 0.95]."""
+    # Float exponent so numba uses libm pow, matching Python bit for bit
+    success_prob = per_ancilla_success ** float(num_measurements)
+    return max(0.1, min(0.95, success_prob))
+
+
+if HAS_NUMBA:
+    bbpssw_output_fidelity = njit(cache=True)(_bbpssw_output_fidelity)
+    dejmps_output_fidelity = njit(cache=True)(_dejmps_output_fidelity)
+    success_probability = njit(cache=True)(_success_probability)
+else:
+    bbpssw_output_fidelity = _bbpssw_output_fidelity
+    dejmps_output_fidelity = _dejmps_output_fidelity
+    success_probability = _success_probability
@@ -6,10 +6,50 @@ no entangling operations across the network boundary. Post-selection via flag bi
 """
 
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from typing import Tuple
+from typing import Dict, Tuple
+from functools import lru_cache
 import numpy as np
 
 
+@lru_cache(maxsize=None)
+def _kernels():
+    """Import the estimate kernels on first use (numba import is slow)."""
+    from distillation import _kernels
+    return _kernels
+
+
+# Estimates are tabulated for every pair count the builders accept
+_MAX_TABULATED_PAIRS = 8
+
+# Distillation rounds by pair count: floor(log2(n)), at least 1
+_ROUNDS = tuple(max(1, n.bit_length() - 1) for n in range(_MAX_TABULATED_PAIRS + 1))
+
+
+# Output fidelity is tabulated on a 0.001 grid over [0.5, 1.0]; edge
+# thresholds and difficulty-derived fidelities land on it
+_FIDELITY_GRID_POINTS = 501
+_FIDELITY_GRID_SCALE = 1000
+
+
+@lru_cache(maxsize=None)
+def _fidelity_table(protocol: str) -> np.ndarray:
+    """Output fidelity by (rounds, grid index), built on first use per protocol."""
+    from distillation._kernels import _bbpssw_output_fidelity, _dejmps_output_fidelity
+    recurrence = _dejmps_output_fidelity if protocol == "dejmps" else _bbpssw_output_fidelity
+    grid = np.linspace(0.5, 1.0, _FIDELITY_GRID_POINTS)
+    # The plain-Python recurrences are elementwise, so they run on the whole grid
+    return np.stack([recurrence(grid, rounds) for rounds in range(max(_ROUNDS) + 1)])
+
+
+@lru_cache(maxsize=None)
+def _success_table(per_ancilla_success: float) -> Tuple[float, ...]:
+    """Success probability by pair count (built on first use, via the kernels)."""
+    return tuple(
+        _kernels().success_probability(2 * (n - 1), per_ancilla_success)
+        for n in range(_MAX_TABULATED_PAIRS + 1)
+    )
+
+
 def create_bbpssw_circuit(num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
     """
     BBPSSW distillation circuit.
@@ -51,37 +91,21 @@ def create_bbpssw_circuit(num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
         if k != N - 1:  # Skip target pair
             ancilla_pairs.append((alice_qubit, bob_qubit))
     
+    # Interleaved (alice, bob) ancillas and their targets, so each gate
+    # family is appended in one broadcast call in the per-pair order
+    ancilla_bits = [q for pair in ancilla_pairs for q in pair]
+    pair_targets = [target_alice, target_bob] * len(ancilla_pairs)
+    
     # BBPSSW protocol: bilateral CNOT between target and each ancilla
-    for alice_anc, bob_anc in ancilla_pairs:
-        # Alice side: CNOT from target to ancilla
-        circuit.cx(target_alice, alice_anc)
-        
-        # Bob side: CNOT from target to ancilla
-        circuit.cx(target_bob, bob_anc)
+    # (Alice side and Bob side, target → ancilla)
+    circuit.cx(pair_targets, ancilla_bits)
     
     # Measure all ancilla qubits
-    ancilla_bits = []
-    for alice_anc, bob_anc in ancilla_pairs:
-        circuit.measure(alice_anc, alice_anc)
-        circuit.measure(bob_anc, bob_anc)
-        ancilla_bits.extend([alice_anc, bob_anc])
+    circuit.measure(ancilla_bits, ancilla_bits)
     
-    # Compute flag: XOR of all ancilla measurement results
-    # Flag = 0 means no errors detected (success)
-    # We'll use the first ancilla bit as the flag accumulator
-    if len(ancilla_bits) > 0:
-        flag_bit = ancilla_bits[0]
-        
-        # XOR all other ancilla bits into the flag
-        for bit in ancilla_bits[1:]:
-            # Classical XOR: measure bit, then conditionally flip flag
-            # In QASM, we can't do classical XOR directly, so we use the first bit
-            pass
-        
-        # For simplicity, use the first Alice ancilla as flag
-        flag_bit = ancilla_pairs[0][0] if ancilla_pairs else 0
-    else:
-        flag_bit = 0
+    # Flag: QASM has no classical XOR, so the first Alice ancilla stands in
+    # for the parity of all ancilla outcomes (0 = no error detected)
+    flag_bit = ancilla_pairs[0][0] if ancilla_pairs else 0
     
     return circuit, flag_bit
 
@@ -133,42 +157,31 @@ def create_dejmps_circuit(num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
         if k != N - 1:
             ancilla_pairs.append((alice_qubit, bob_qubit))
     
+    # Interleaved (alice, bob) ancillas and their targets, so each gate
+    # family is appended in one broadcast call in the per-pair order
+    ancilla_bits = [q for pair in ancilla_pairs for q in pair]
+    pair_targets = [target_alice, target_bob] * len(ancilla_pairs)
+    
     # DEJMPS protocol: X-basis and Z-basis parity checks
     
     # Step 1: Z-basis parity check (detect phase errors)
-    for alice_anc, bob_anc in ancilla_pairs:
-        # CNOT from target to ancilla (Z-basis check)
-        circuit.cx(target_alice, alice_anc)
-        circuit.cx(target_bob, bob_anc)
+    # CNOT from target to ancilla (Z-basis check)
+    circuit.cx(pair_targets, ancilla_bits)
     
     # Step 2: X-basis parity check (detect bit-flip errors)
     # Apply Hadamard to change basis
-    for alice_anc, bob_anc in ancilla_pairs:
-        circuit.h(alice_anc)
-        circuit.h(bob_anc)
-    
-    circuit.h(target_alice)
-    circuit.h(target_bob)
+    circuit.h(ancilla_bits)
+    circuit.h([target_alice, target_bob])
     
     # CNOT in X-basis (equivalent to CZ in computational basis)
-    for alice_anc, bob_anc in ancilla_pairs:
-        circuit.cx(target_alice, alice_anc)
-        circuit.cx(target_bob, bob_anc)
+    circuit.cx(pair_targets, ancilla_bits)
     
     # Return to computational basis
-    for alice_anc, bob_anc in ancilla_pairs:
-        circuit.h(alice_anc)
-        circuit.h(bob_anc)
-    
-    circuit.h(target_alice)
-    circuit.h(target_bob)
+    circuit.h(ancilla_bits)
+    circuit.h([target_alice, target_bob])
     
     # Measure ancilla qubits
-    ancilla_bits = []
-    for alice_anc, bob_anc in ancilla_pairs:
-        circuit.measure(alice_anc, alice_anc)
-        circuit.measure(bob_anc, bob_anc)
-        ancilla_bits.extend([alice_anc, bob_anc])
+    circuit.measure(ancilla_bits, ancilla_bits)
     
     # Flag bit: first ancilla (should be 0 for success)
     flag_bit = ancilla_pairs[0][0] if ancilla_pairs else 0
@@ -197,6 +210,101 @@ def create_adaptive_distillation_circuit(
         return create_bbpssw_circuit(num_bell_pairs)
 
 
+# (protocol, num_bell_pairs) -> (circuit, flag_bit); built once, never mutated
+_circuit_templates: Dict[Tuple[str, int], Tuple[QuantumCircuit, int]] = {}
+
+
+def get_circuit_template(protocol: str, num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
+    """
+    Shared circuit for a protocol, built once per (protocol, num_bell_pairs).
+    
+    Every caller gets the same object, so it must only be read (validated,
+    simulated, serialized); use get_distillation_circuit() to modify one.
+    
+    Args:
+        protocol: "bbpssw" or "dejmps" (anything else builds BBPSSW)
+        num_bell_pairs: Number of raw Bell pairs (2-8)
+        
+    Returns:
+        (circuit, flag_bit)
+    """
+    protocol = "dejmps" if protocol == "dejmps" else "bbpssw"
+    key = (protocol, num_bell_pairs)
+    template = _circuit_templates.get(key)
+    if template is None:
+        builder = create_dejmps_circuit if protocol == "dejmps" else create_bbpssw_circuit
+        template = _circuit_templates[key] = builder(num_bell_pairs)
+    return template
+
+
+def get_distillation_circuit(protocol: str, num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
+    """
+    Fresh circuit for a protocol, safe for the caller to modify.
+    
+    Returns template.copy(), which clones the instruction data instead of
+    re-running the gate construction.
+    
+    Args:
+        protocol: "bbpssw" or "dejmps" (anything else builds BBPSSW)
+        num_bell_pairs: Number of raw Bell pairs (2-8)
+        
+    Returns:
+        (circuit, flag_bit)
+    """
+    circuit, flag_bit = get_circuit_template(protocol, num_bell_pairs)
+    return circuit.copy(), flag_bit
+
+
+@lru_cache(maxsize=64)
+def get_circuit_depth(protocol: str, num_bell_pairs: int) -> int:
+    """
+    Depth of a protocol's circuit, computed once per (protocol, num_bell_pairs).
+    
+    Depth is structural, so it is read off the shared template rather than a
+    fresh circuit (QuantumCircuit.depth() walks every instruction).
+    """
+    circuit, _ = get_circuit_template(protocol, num_bell_pairs)
+    return circuit.depth()
+
+
+def analytical_depth(protocol: str, num_bell_pairs: int) -> int:
+    """
+    Circuit depth of a protocol without building the circuit.
+    
+    All ancilla CNOTs share the target pair, so they run one after another:
+    BBPSSW is N-1 CNOT layers plus the measurement (N); DEJMPS doubles the
+    CNOT layers and adds two Hadamard layers (2N+1).
+    """
+    if protocol == "dejmps":
+        return 2 * (num_bell_pairs - 1) + 3
+    return num_bell_pairs
+
+
+@lru_cache(maxsize=None)
+def _pass_manager():
+    """Backend-independent optimization_level=3 pass manager, built on first use."""
+    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+    return generate_preset_pass_manager(optimization_level=3)
+
+
+# (protocol, num_bell_pairs) -> transpiled circuit; only ever copied
+_transpiled_templates: Dict[Tuple[str, int], QuantumCircuit] = {}
+
+
+def get_transpiled_distillation(protocol: str, num_bell_pairs: int) -> QuantumCircuit:
+    """
+    Optimized (optimization_level=3, no target backend) copy of a protocol's circuit.
+    
+    Transpiles once per (protocol, num_bell_pairs); later calls return a copy.
+    """
+    key = (protocol, num_bell_pairs)
+    transpiled = _transpiled_templates.get(key)
+    if transpiled is None:
+        circuit, _ = get_distillation_circuit(protocol, num_bell_pairs)
+        transpiled = _transpiled_templates[key] = _pass_manager().run(circuit)
+    return transpiled.copy()
+
+
 def create_recursive_distillation_circuit(num_bell_pairs: int) -> Tuple[QuantumCircuit, int]:
     """
     Recursive distillation for higher fidelity with more Bell pairs.
@@ -304,13 +412,12 @@ def estimate_success_probability(num_bell_pairs: int, protocol: str = "bbpssw")
     else:
         per_ancilla_success = 0.70
     
-    # Total success probability (assuming independent checks)
-    # Each ancilla pair has 2 qubits measured
+    # Total success probability (assuming independent checks), clamped to a
+    # reasonable range. Each ancilla pair has 2 qubits measured
+    if 0 <= num_bell_pairs <= _MAX_TABULATED_PAIRS:
+        return _success_table(per_ancilla_success)[num_bell_pairs]
     total_measurements = 2 * num_ancillas
-    success_prob = per_ancilla_success ** total_measurements
-    
-    # Clamp to reasonable range
-    return max(0.1, min(0.95, success_prob))
+    return _kernels().success_probability(total_measurements, per_ancilla_success)
 
 
 def estimate_output_fidelity(
@@ -321,9 +428,10 @@ def estimate_output_fidelity(
     """
     Estimate output fidelity after distillation.
     
-    Uses theoretical bounds for distillation protocols:
-    - BBPSSW: F_out ≈ F_in^2 / (F_in^2 + (1-F_in)^2) for 2 pairs
-    - More pairs: recursive application
+    Closed-form recurrences for Werner-state input, one round per halving
+    of the pair count:
+    - BBPSSW: F' = (F^2 + e^2) / (F^2 + 2Fe + 5e^2), e = (1-F)/3
+    - DEJMPS: Bell-diagonal update of (A, B, C, D), starting at (F, e, e, e)
     
     Args:
         input_fidelity: Fidelity of raw Bell pairs
@@ -337,19 +445,21 @@ def estimate_output_fidelity(
         # Below 0.5, distillation doesn't help
         return input_fidelity
     
-    F = input_fidelity
-    
-    # Single distillation step (2 pairs -> 1 pair)
-    def single_step_fidelity(f):
-        # BBPSSW formula
-        f_out = f**2 / (f**2 + (1 - f)**2)
-        return f_out
-    
-    # Apply distillation rounds
     # Each round uses 2 pairs to make 1 pair
-    rounds = int(np.log2(num_bell_pairs))
-    
-    for _ in range(max(1, rounds)):
-        F = single_step_fidelity(F)
+    if 0 <= num_bell_pairs <= _MAX_TABULATED_PAIRS:
+        rounds = _ROUNDS[num_bell_pairs]
+    else:
+        rounds = max(1, int(num_bell_pairs).bit_length() - 1)  # floor(log2)
+    
+    # Table lookup when the input sits on the grid, else the recurrence
+    position = (input_fidelity - 0.5) * _FIDELITY_GRID_SCALE
+    index = round(position)
+    if rounds <= _ROUNDS[-1] and index < _FIDELITY_GRID_POINTS and abs(index - position) < 1e-9:
+        protocol_key = "dejmps" if protocol == "dejmps" else "bbpssw"
+        F = float(_fidelity_table(protocol_key)[rounds, index])
+    elif protocol == "dejmps":
+        F = _kernels().dejmps_output_fidelity(input_fidelity, rounds)
+    else:
+        F = _kernels().bbpssw_output_fidelity(input_fidelity, rounds)
     
     return min(0.99, F)  # Cap at 99%
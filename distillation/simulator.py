@@ -11,9 +11,35 @@ This helps avoid wasting server-side bell-pair budget on low-quality attempts.
 
 from qiskit import QuantumCircuit, transpile
 from qiskit.quantum_info import Statevector, DensityMatrix, state_fidelity
-from qiskit_aer import AerSimulator
 import numpy as np
 from typing import Tuple, Dict, Any, Optional
+from functools import lru_cache
+
+from distillation.distillation import estimate_output_fidelity
+
+
+@lru_cache(maxsize=256)
+def _analytic_estimate(num_bell_pairs: int, input_noise: float, protocol: str = "bbpssw") -> Tuple[float, float]:
+    """
+    Analytical (fidelity, success probability) for distillation, memoized.
+    
+    No shots are sampled: the agent calls this for every candidate claim, and
+    the inputs come from a small set of pair counts and difficulty levels.
+    """
+    # Output fidelity from the same Werner-state recurrence the planner uses
+    F = estimate_output_fidelity(1 - input_noise, num_bell_pairs, protocol)
+    
+    # Success probability estimation (heuristic)
+    # Each ancilla pair measurement has ~70% pass rate (empirical)
+    # This is based on typical post-selection behavior in distillation
+    num_measurements = 2 * (num_bell_pairs - 1)  # Ancilla pairs measured
+    BASE_PASS_RATE = 0.7  # Empirical estimate per measurement
+    success_prob = BASE_PASS_RATE ** num_measurements
+    
+    # Clamp to a realistic range (the fidelity is already capped at 0.99)
+    success_prob = max(0.05, min(0.95, success_prob))
+    
+    return F, success_prob
 
 
 class DistillationSimulator:
@@ -34,7 +60,15 @@ class DistillationSimulator:
             shots: Number of shots for statistical sampling
         """
         self.shots = shots
-        self.simulator = AerSimulator()
+        self._simulator = None
+    
+    @property
+    def simulator(self):
+        """AerSimulator for shot-based runs, created on first use (estimates are analytic)."""
+        if self._simulator is None:
+            from qiskit_aer import AerSimulator
+            self._simulator = AerSimulator()
+        return self._simulator
     
     def create_noisy_bell_state(
         self,
@@ -135,7 +169,8 @@ class DistillationSimulator:
         flag_bit: int,
         num_bell_pairs: int,
         input_noise: float = 0.15,
-        noise_type: str = "depolarizing"
+        noise_type: str = "depolarizing",
+        protocol: str = "bbpssw"
     ) -> Tuple[float, float]:
         """
         Estimate output fidelity and success probability.
@@ -146,39 +181,14 @@ class DistillationSimulator:
             num_bell_pairs: Number of input Bell pairs
             input_noise: Input noise probability
             noise_type: Type of noise
+            protocol: "bbpssw" or "dejmps" (selects the fidelity recurrence)
             
         Returns:
             (estimated_fidelity, success_probability)
         """
         try:
-            # For fast estimation, use analytical approximation
-            # Based on theoretical distillation formulas
-            
-            # Input fidelity from noise parameter
-            F_in = 1 - input_noise
-            
-            # Estimate output fidelity based on number of pairs
-            # Single distillation step formula (BBPSSW):
-            # F_out ≈ F_in^2 / (F_in^2 + (1-F_in)^2)
-            # This is the theoretical bound for 2-to-1 distillation
-            F = F_in
-            rounds = max(1, int(np.log2(num_bell_pairs)))
-            
-            for _ in range(rounds):
-                F = F**2 / (F**2 + (1 - F)**2)
-            
-            # Success probability estimation (heuristic)
-            # Each ancilla pair measurement has ~70% pass rate (empirical)
-            # This is based on typical post-selection behavior in distillation
-            num_measurements = 2 * (num_bell_pairs - 1)  # Ancilla pairs measured
-            BASE_PASS_RATE = 0.7  # Empirical estimate per measurement
-            success_prob = BASE_PASS_RATE ** num_measurements
-            
-            # Clamp values to realistic ranges
-            F = max(0.5, min(0.99, F))
-            success_prob = max(0.05, min(0.95, success_prob))
-            
-            return F, success_prob
+            # Closed-form estimate; depends only on (num_bell_pairs, input_noise, protocol)
+            return _analytic_estimate(num_bell_pairs, input_noise, protocol)
         
         except Exception as e:
             # Fallback: conservative estimates
@@ -189,7 +199,8 @@ class DistillationSimulator:
         circuit: QuantumCircuit,
         flag_bit: int,
         num_bell_pairs: int,
-        input_noise: float = 0.15
+        input_noise: float = 0.15,
+        protocol: str = "bbpssw"
     ) -> Dict[str, Any]:
         """
         Full simulation of distillation circuit.
@@ -199,6 +210,7 @@ class DistillationSimulator:
             flag_bit: Classical bit for post-selection
             num_bell_pairs: Number of input Bell pairs
             input_noise: Input noise probability
+            protocol: "bbpssw" or "dejmps"
             
         Returns:
             Dictionary with simulation results
@@ -206,7 +218,7 @@ class DistillationSimulator:
         try:
             # Quick analytical estimate (full simulation is expensive)
             fidelity, success_prob = self.estimate_fidelity(
-                circuit, flag_bit, num_bell_pairs, input_noise
+                circuit, flag_bit, num_bell_pairs, input_noise, protocol=protocol
             )
             
             return {
@@ -275,7 +287,8 @@ class DistillationSimulator:
         flag_bit: int,
         num_bell_pairs: int,
         threshold: float,
-        input_noise: float = 0.15
+        input_noise: float = 0.15,
+        protocol: str = "bbpssw"
     ) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Decide whether to submit circuit based on simulation.
@@ -286,6 +299,7 @@ class DistillationSimulator:
             num_bell_pairs: Number of Bell pairs
             threshold: Required fidelity threshold
             input_noise: Estimated input noise
+            protocol: "bbpssw" or "dejmps"
             
         Returns:
             (should_submit, reason, simulation_results)
@@ -296,7 +310,7 @@ class DistillationSimulator:
             return False, f"Invalid circuit: {error}", {}
         
         # Simulate
-        results = self.simulate_circuit(circuit, flag_bit, num_bell_pairs, input_noise)
+        results = self.simulate_circuit(circuit, flag_bit, num_bell_pairs, input_noise, protocol)
         
         if not results['valid']:
             return False, f"Simulation failed: {results['error']}", results
@@ -317,10 +331,13 @@ class DistillationSimulator:
         return True, "Simulation passed", results
 
 
+@lru_cache(maxsize=32)
 def estimate_input_noise_from_difficulty(difficulty: float) -> float:
     """
     Estimate input noise probability from edge difficulty rating.
     
+    Pure function of a small difficulty domain (1-10), so results are memoized.
+    
     Args:
         difficulty: Difficulty rating (1-10)
         
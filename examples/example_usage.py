@@ -8,11 +8,16 @@ Demonstrates:
 4. Custom agent configuration
 """
 
+import sys
+
 from core.client import GameClient
 from distillation.distillation import (
+    analytical_depth,
     create_bbpssw_circuit,
     create_dejmps_circuit,
-    estimate_output_fidelity
+    estimate_output_fidelity,
+    get_circuit_depth,
+    get_transpiled_distillation
 )
 from strategy.strategy import EdgeSelectionStrategy, BudgetManager
 from distillation.simulator import DistillationSimulator, estimate_input_noise_from_difficulty
@@ -136,6 +141,15 @@ def example_edge_selection():
 # EXAMPLE 3: Budget-Aware Decision Making
 # ============================================================================
 
+_EDGE_TMPL = (
+    "\n{edge_id}: {status}\n"
+    "  ROI: {roi:.2f}\n"
+    "  Cost: {cost:.1f}\n"
+    "  Success prob: {p:.2%}\n"
+    "  Reason: {reason}"
+)
+
+
 def example_budget_management():
     """Example: Use budget manager to make decisions."""
     print("\n" + "=" * 60)
@@ -150,7 +164,7 @@ def example_budget_management():
     )
     
     # Simulate edge scores
-    from strategy.strategy import EdgeScore
+    from strategy.strategy import EdgeScore, edge_score_arrays
     
     edges = [
         EdgeScore(
@@ -194,18 +208,23 @@ def example_budget_management():
     print(f"Min reserve: {budget_manager.min_reserve}")
     print(f"Risk tolerance: {budget_manager.risk_tolerance}")
     
+    # Evaluate every edge in one vectorized pass; reasons only for rejections
+    approved = budget_manager.filter_edges(edge_score_arrays(edges), current_budget)
+    
     print("\nEvaluating edges:")
-    for edge_score in edges:
-        should_attempt, reason = budget_manager.should_attempt_edge(
-            edge_score, current_budget
-        )
+    for edge_score, should_attempt in zip(edges, approved):
+        reason = "Approved"
+        if not should_attempt:
+            _, reason = budget_manager.should_attempt_edge(edge_score, current_budget)
         
-        status = "✓ APPROVE" if should_attempt else "✗ REJECT"
-        print(f"\n{edge_score.edge_id}: {status}")
-        print(f"  ROI: {edge_score.roi:.2f}")
-        print(f"  Cost: {edge_score.expected_cost:.1f}")
-        print(f"  Success prob: {edge_score.estimated_success_prob:.2%}")
-        print(f"  Reason: {reason}")
+        print(_EDGE_TMPL.format_map({
+            'edge_id': edge_score.edge_id,
+            'status': "✓ APPROVE" if should_attempt else "✗ REJECT",
+            'roi': edge_score.roi,
+            'cost': edge_score.expected_cost,
+            'p': edge_score.estimated_success_prob,
+            'reason': reason,
+        }))
 
 
 # ============================================================================
@@ -315,8 +334,12 @@ def example_complete_flow():
 # EXAMPLE 6: Custom Protocol Selection
 # ============================================================================
 
-def example_protocol_selection():
-    """Example: Compare different distillation protocols."""
+def example_protocol_selection(with_circuit: bool = False):
+    """Example: Compare different distillation protocols.
+    
+    Fidelities and depths come from closed forms; circuits are only built
+    (to report measured and transpiled depth) when with_circuit is set.
+    """
     print("\n" + "=" * 60)
     print("EXAMPLE 6: Protocol Comparison")
     print("=" * 60)
@@ -331,17 +354,23 @@ def example_protocol_selection():
     
     # BBPSSW
     print("\nBBPSSW Protocol:")
-    circuit_bbpssw, flag_bbpssw = create_bbpssw_circuit(num_bell_pairs)
     fidelity_bbpssw = estimate_output_fidelity(input_fidelity, num_bell_pairs, "bbpssw")
-    print(f"  - Circuit depth: {circuit_bbpssw.depth()}")
+    if with_circuit:
+        print(f"  - Circuit depth: {get_circuit_depth('bbpssw', num_bell_pairs)}")
+        print(f"  - Transpiled depth: {get_transpiled_distillation('bbpssw', num_bell_pairs).depth()}")
+    else:
+        print(f"  - Circuit depth: {analytical_depth('bbpssw', num_bell_pairs)}")
     print(f"  - Estimated output fidelity: {fidelity_bbpssw:.3f}")
     print(f"  - Improvement: {fidelity_bbpssw - input_fidelity:+.3f}")
     
     # DEJMPS
     print("\nDEJMPS Protocol:")
-    circuit_dejmps, flag_dejmps = create_dejmps_circuit(num_bell_pairs)
     fidelity_dejmps = estimate_output_fidelity(input_fidelity, num_bell_pairs, "dejmps")
-    print(f"  - Circuit depth: {circuit_dejmps.depth()}")
+    if with_circuit:
+        print(f"  - Circuit depth: {get_circuit_depth('dejmps', num_bell_pairs)}")
+        print(f"  - Transpiled depth: {get_transpiled_distillation('dejmps', num_bell_pairs).depth()}")
+    else:
+        print(f"  - Circuit depth: {analytical_depth('dejmps', num_bell_pairs)}")
     print(f"  - Estimated output fidelity: {fidelity_dejmps:.3f}")
     print(f"  - Improvement: {fidelity_dejmps - input_fidelity:+.3f}")
     
@@ -370,7 +399,7 @@ def main():
         example_edge_selection()
         example_budget_management()
         example_autonomous_agent_dry_run()
-        example_protocol_selection()
+        example_protocol_selection(with_circuit="--with-circuit" in sys.argv)
         example_complete_flow()
         
         print("\n" + "=" * 60)
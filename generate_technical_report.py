@@ -11,37 +11,114 @@ from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image,
-    Table, TableStyle, KeepTogether, ListFlowable, ListItem
+    Table, TableStyle, CondPageBreak
 )
 from reportlab.lib import colors
+import reportlab
+from reportlab import rl_config
+from PIL import Image as PILImage
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import io
 import os
 
+# The report's content lives in this file, so its bytes key the build cache
+_SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+# Ends every section. Unlike other flowables it is never framed or split:
+# doc.build only reads it as a "new page" marker, so one instance is shared
+_PAGE_BREAK = PageBreak()
+
+
+@lru_cache(maxsize=512)
+def _parsed_paragraph(text, style_name):
+    """Paragraph parsed once per (text, style); callers get fresh copies via _paragraph."""
+    return Paragraph(text, QuantumNetworkTechnicalReport._get_styles()[style_name])
+
+
 class QuantumNetworkTechnicalReport:
     """Generate comprehensive technical report for quantum networking solution."""
     
-    def __init__(self, output_filename="Quantum_Network_Optimization_Technical_Report.pdf"):
+    # Sample stylesheet plus custom styles, built once and shared (never mutated after)
+    _shared_styles = None
+    
+    # Figures are embedded at this resolution (the notebook PNGs are 300 dpi)
+    IMAGE_DPI = 150
+    
+    # (image path, pixel size) -> PNG bytes of the resampled raster, so later
+    # builds in this process skip decoding and resizing the full-size figure
+    _image_rasters = {}
+    
+    # Applied to every table; Table.setStyle only reads it, so one instance is shared
+    _DEFAULT_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
+    ])
+    
+    # Section builders in report order; generate_complete_report walks this table
+    _SECTIONS = (
+        '_add_problem_statement',      # 1. Problem Statement
+        '_add_system_architecture',    # 2. System Architecture
+        '_add_distillation_design',    # 3. Quantum Distillation Design
+        '_add_resource_management',    # 4. Resource Management
+        '_add_agentic_control',        # 5. Agentic Control
+        '_add_edge_selection',         # 6. Edge Selection Strategy
+        '_add_visualization',          # 7. Visualization
+        '_add_results',                # 8. Results
+        '_add_real_world_relevance',   # 9. Real-World Relevance
+        '_add_limitations',            # 10. Limitations & Future Work
+        '_add_conclusion',             # 11. Conclusion
+    )
+    
+    def __init__(self, output_filename="Quantum_Network_Optimization_Technical_Report.pdf", debug=False):
         self.output_filename = output_filename
+        # debug keeps ReportLab's attribute validation on while building
+        self.debug = debug
+        # The PDF is rendered into memory and written to output_filename in one go
+        self._buffer = io.BytesIO()
         self.doc = SimpleDocTemplate(
-            output_filename,
+            self._buffer,
             pagesize=letter,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
             topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+            bottomMargin=0.75*inch,
+            pageCompression=1
         )
-        self.styles = getSampleStyleSheet()
+        self.styles = type(self)._get_styles()
         self.story = []
-        
-        # Custom styles
-        self._setup_custom_styles()
+        # directory -> file names, listed once per report build (see _image_exists)
+        self._dir_listings = {}
+        # figure files embedded by the current build; their stats feed _fingerprint
+        self._figures = []
+    
+    @classmethod
+    def _get_styles(cls):
+        """Stylesheet with the custom styles, built on first use per process."""
+        if cls._shared_styles is None:
+            styles = getSampleStyleSheet()
+            cls._setup_custom_styles(styles)
+            cls._shared_styles = styles
+        return cls._shared_styles
     
-    def _setup_custom_styles(self):
+    @staticmethod
+    def _setup_custom_styles(styles):
         """Setup custom paragraph styles."""
         # Title style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=30,
@@ -50,9 +127,9 @@ class QuantumNetworkTechnicalReport:
         ))
         
         # Subtitle style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='Subtitle',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=14,
             textColor=colors.HexColor('#555555'),
             spaceAfter=12,
@@ -61,9 +138,9 @@ class QuantumNetworkTechnicalReport:
         ))
         
         # Section header
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=16,
             textColor=colors.HexColor('#2c3e50'),
             spaceAfter=12,
@@ -72,9 +149,9 @@ class QuantumNetworkTechnicalReport:
         ))
         
         # Subsection header
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SubsectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=13,
             textColor=colors.HexColor('#34495e'),
             spaceAfter=10,
@@ -83,19 +160,28 @@ class QuantumNetworkTechnicalReport:
         ))
         
         # Body text
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='BodyJustify',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=11,
             alignment=TA_JUSTIFY,
             spaceAfter=12,
             leading=14
         ))
         
+        # Bullet list item (bullet hangs in the left margin of the item text)
+        styles.add(ParagraphStyle(
+            name='BulletItem',
+            parent=styles['BodyText'],
+            leftIndent=35,
+            bulletIndent=0,
+            bulletFontSize=10
+        ))
+        
         # Code style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomCode',
-            parent=self.styles['Code'],
+            parent=styles['Code'],
             fontSize=9,
             leftIndent=20,
             rightIndent=20,
@@ -109,17 +195,17 @@ class QuantumNetworkTechnicalReport:
         self.story.append(Spacer(1, 2*inch))
         
         # Main title
-        title = Paragraph(
+        title = self._paragraph(
             "Agentic Quantum Network Optimization<br/>via Entanglement Distillation",
-            self.styles['CustomTitle']
+            'CustomTitle'
         )
         self.story.append(title)
         self.story.append(Spacer(1, 0.3*inch))
         
         # Subtitle
-        subtitle = Paragraph(
+        subtitle = self._paragraph(
             "IonQ Quantum Networking Hackathon 2026",
-            self.styles['Subtitle']
+            'Subtitle'
         )
         self.story.append(subtitle)
         self.story.append(Spacer(1, 0.5*inch))
@@ -133,54 +219,38 @@ class QuantumNetworkTechnicalReport:
         <br/>
         Generated: {datetime.now().strftime('%B %d, %Y')}
         """
-        info = Paragraph(info_text, self.styles['Subtitle'])
+        # Only the date varies, so the parse is cached for the whole day
+        info = self._paragraph(info_text, 'Subtitle')
         self.story.append(info)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
+    
+    def _paragraph(self, text, style_name):
+        """New Paragraph reusing the cached markup parse of (text, style_name)."""
+        parsed = _parsed_paragraph(text, style_name)
+        return Paragraph(parsed.text, parsed.style, parsed.bulletText, frags=list(parsed.frags))
+    
+    def _heading_flow(self, title, heading_style, content_paragraphs, space_after):
+        """Heading, body paragraphs (strings parsed as BodyJustify) and a trailing spacer."""
+        paragraph = self._paragraph
+        flow = [paragraph(title, heading_style)]
+        flow += [paragraph(para, 'BodyJustify') if isinstance(para, str) else para
+                 for para in content_paragraphs]
+        flow.append(Spacer(1, space_after))
+        self.story.extend(flow)
     
     def add_section(self, title, content_paragraphs):
         """Add a section with title and content."""
-        # Section title
-        section_title = Paragraph(title, self.styles['SectionHeader'])
-        self.story.append(section_title)
-        
-        # Content
-        for para in content_paragraphs:
-            if isinstance(para, str):
-                p = Paragraph(para, self.styles['BodyJustify'])
-                self.story.append(p)
-            else:
-                self.story.append(para)
-        
-        self.story.append(Spacer(1, 0.2*inch))
+        self._heading_flow(title, 'SectionHeader', content_paragraphs, 0.2*inch)
     
     def add_subsection(self, title, content_paragraphs):
         """Add a subsection."""
-        subsection_title = Paragraph(title, self.styles['SubsectionHeader'])
-        self.story.append(subsection_title)
-        
-        for para in content_paragraphs:
-            if isinstance(para, str):
-                p = Paragraph(para, self.styles['BodyJustify'])
-                self.story.append(p)
-            else:
-                self.story.append(para)
-        
-        self.story.append(Spacer(1, 0.15*inch))
+        self._heading_flow(title, 'SubsectionHeader', content_paragraphs, 0.15*inch)
     
     def add_bullet_list(self, items):
-        """Add a bullet list."""
-        bullet_items = []
+        """Add a bullet list (one hanging-bullet Paragraph per item)."""
         for item in items:
-            bullet_items.append(ListItem(Paragraph(item, self.styles['BodyText'])))
-        
-        bullet_list = ListFlowable(
-            bullet_items,
-            bulletType='bullet',
-            leftIndent=35,
-            bulletFontSize=10
-        )
-        self.story.append(bullet_list)
+            self.story.append(self._paragraph(f"<bullet>&bull;</bullet>{item}", 'BulletItem'))
         self.story.append(Spacer(1, 0.1*inch))
     
     def add_table(self, data, col_widths=None):
@@ -189,85 +259,117 @@ class QuantumNetworkTechnicalReport:
             col_widths = [2*inch] * len(data[0])
         
         table = Table(data, colWidths=col_widths)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
-        ]))
+        table.setStyle(type(self)._DEFAULT_TABLE_STYLE)
         
         self.story.append(table)
         self.story.append(Spacer(1, 0.2*inch))
     
+    def _image_exists(self, image_path):
+        """Existence check against one cached listing per directory instead of a stat per image."""
+        directory, name = os.path.split(image_path)
+        listing = self._dir_listings.get(directory)
+        if listing is None:
+            try:
+                listing = set(os.listdir(directory or '.'))
+            except OSError:
+                listing = set()
+            self._dir_listings[directory] = listing
+        return name in listing
+    
+    @classmethod
+    def _image_raster(cls, image_path, width, height):
+        """PNG bytes of a figure resampled to the drawn size (cached after first use)."""
+        size = (round(width / inch * cls.IMAGE_DPI), round(height / inch * cls.IMAGE_DPI))
+        key = (image_path, size)
+        raster = cls._image_rasters.get(key)
+        if raster is None:
+            with PILImage.open(image_path) as src:
+                resized = src.resize(size, PILImage.LANCZOS) if src.size != size else src.copy()
+            buffer = io.BytesIO()
+            resized.save(buffer, format='PNG')
+            raster = cls._image_rasters[key] = buffer.getvalue()
+        return raster
+    
     def add_image_if_exists(self, image_path, width=5*inch, caption=None):
         """Add image if file exists."""
-        if os.path.exists(image_path):
+        if self._image_exists(image_path):
             try:
-                # Use KeepTogether to prevent splitting across pages
-                img = Image(image_path, width=width, height=4*inch)
+                height = 4*inch
+                # Image accepts a file-like object; feed it the resampled raster
+                raster = io.BytesIO(self._image_raster(image_path, width, height))
+                img = Image(raster, width=width, height=height)
                 img.hAlign = 'CENTER'
                 
                 elements = [img]
                 if caption:
-                    cap = Paragraph(f"<i>{caption}</i>", self.styles['Normal'])
+                    cap = self._paragraph(f"<i>{caption}</i>", 'Normal')
                     elements.append(cap)
                 
-                # Wrap in KeepTogether
-                self.story.append(KeepTogether(elements))
+                # Keep figure and caption on one page: their heights are known up
+                # front, so a CondPageBreak replaces KeepTogether's trial layout
+                needed = sum(e.wrap(self.doc.width, self.doc.height)[1] for e in elements)
+                self.story.append(CondPageBreak(needed))
+                self.story.extend(elements)
                 self.story.append(Spacer(1, 0.2*inch))
+                self._figures.append(image_path)
             except Exception as e:
                 print(f"Warning: Could not load image {image_path}: {e}")
     
-    def generate_complete_report(self):
-        """Generate the complete technical report."""
+    def _fingerprint(self):
+        """Hash of everything the PDF depends on: this source, ReportLab, the date and the figures."""
+        digest = hashlib.sha256(_SOURCE_DIGEST)
+        digest.update(f"{reportlab.Version}|{datetime.now().date().isoformat()}".encode())
+        for image_path in self._figures:
+            stat = os.stat(image_path)
+            digest.update(f"|{image_path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+    
+    def generate_complete_report(self, force=False):
+        """
+        Generate the complete technical report and return the PDF bytes.
+        
+        The build is skipped when output_filename and its .hash sidecar match
+        the current inputs (see _fingerprint); force=True always rebuilds.
+        """
         print("Generating technical report...")
+        self.story = []
+        self._dir_listings = {}
+        self._figures = []
         
         # Title page
         self.add_title_page()
         
-        # 1. Problem Statement
-        self._add_problem_statement()
-        
-        # 2. System Architecture
-        self._add_system_architecture()
-        
-        # 3. Quantum Distillation Design
-        self._add_distillation_design()
-        
-        # 4. Resource Management
-        self._add_resource_management()
-        
-        # 5. Agentic Control
-        self._add_agentic_control()
-        
-        # 6. Edge Selection Strategy
-        self._add_edge_selection()
-        
-        # 7. Visualization
-        self._add_visualization()
-        
-        # 8. Results
-        self._add_results()
-        
-        # 9. Real-World Relevance
-        self._add_real_world_relevance()
-        
-        # 10. Limitations & Future Work
-        self._add_limitations()
-        
-        # 11. Conclusion
-        self._add_conclusion()
-        
-        # Build PDF
-        self.doc.build(self.story)
+        # Sections 1-11, in report order
+        for section in type(self)._SECTIONS:
+            getattr(self, section)()
+        
+        # Story assembly is cheap; layout and writing are not, so stop here if
+        # the last build already produced this exact report
+        output = Path(self.output_filename)
+        stamp = output.with_name(output.name + ".hash")
+        fingerprint = self._fingerprint()
+        if not force and output.exists() and stamp.exists() and stamp.read_text() == fingerprint:
+            print(f"✓ Report up to date: {self.output_filename}")
+            return output.read_bytes()
+        
+        # Build PDF (shape checking validates every attribute set; off unless debugging).
+        # Streams are written as compressed binary: ASCII85-encoding the figure
+        # rasters took about half the build and made the file ~20% larger
+        shape_checking, use_a85 = rl_config.shapeChecking, rl_config.useA85
+        if not self.debug:
+            rl_config.shapeChecking = 0
+        rl_config.useA85 = 0
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        try:
+            self.doc.build(self.story)
+        finally:
+            rl_config.shapeChecking, rl_config.useA85 = shape_checking, use_a85
+        pdf_bytes = self._buffer.getvalue()
+        output.write_bytes(pdf_bytes)
+        stamp.write_text(fingerprint)
         print(f"✓ Report generated: {self.output_filename}")
+        return pdf_bytes
     
     def _add_problem_statement(self):
         """Section 1: Problem Statement."""
@@ -319,7 +421,7 @@ class QuantumNetworkTechnicalReport:
             """
         ])
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_system_architecture(self):
         """Section 2: System Architecture."""
@@ -420,7 +522,7 @@ class QuantumNetworkTechnicalReport:
             """
         ])
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_distillation_design(self):
         """Section 3: Quantum Distillation Design."""
@@ -539,7 +641,7 @@ class QuantumNetworkTechnicalReport:
             """
         ])
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_resource_management(self):
         """Section 4: Resource Management."""
@@ -636,7 +738,7 @@ class QuantumNetworkTechnicalReport:
             """
         ])
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_agentic_control(self):
         """Section 5: Agentic Control."""
@@ -747,7 +849,7 @@ class QuantumNetworkTechnicalReport:
         ]
         self.add_bullet_list(deterministic_points)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_edge_selection(self):
         """Section 6: Edge Selection Strategy."""
@@ -818,7 +920,7 @@ class QuantumNetworkTechnicalReport:
         ]
         self.add_bullet_list(implications)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_visualization(self):
         """Section 7: Visualization."""
@@ -872,7 +974,7 @@ class QuantumNetworkTechnicalReport:
         ]
         self.add_bullet_list(debug_uses)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_results(self):
         """Section 8: Results & Experiments."""
@@ -947,7 +1049,7 @@ class QuantumNetworkTechnicalReport:
         ]
         self.add_bullet_list(findings)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_real_world_relevance(self):
         """Section 9: Real-World Relevance."""
@@ -1072,7 +1174,7 @@ class QuantumNetworkTechnicalReport:
             """
         ])
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_limitations(self):
         """Section 10: Limitations & Future Work."""
@@ -1103,7 +1205,7 @@ class QuantumNetworkTechnicalReport:
         self.add_subsection("10.2 Future Enhancements", [])
         
         # Technical improvements
-        self.story.append(Paragraph("<b>Technical Improvements:</b>", self.styles['BodyText']))
+        self.story.append(self._paragraph("<b>Technical Improvements:</b>", 'BodyText'))
         
         technical = [
             "<b>Reinforcement Learning Agent:</b> Replace heuristics with RL policy trained on game outcomes. Use PPO or DQN to learn optimal edge selection and resource allocation.",
@@ -1115,7 +1217,7 @@ class QuantumNetworkTechnicalReport:
         self.add_bullet_list(technical)
         
         # Real-world extensions
-        self.story.append(Paragraph("<b>Real-World Extensions:</b>", self.styles['BodyText']))
+        self.story.append(self._paragraph("<b>Real-World Extensions:</b>", 'BodyText'))
         
         real_world = [
             "<b>Entanglement Swapping:</b> Chain distilled pairs across multiple hops to create long-distance entanglement.",
@@ -1139,7 +1241,7 @@ class QuantumNetworkTechnicalReport:
         ]
         self.add_bullet_list(research)
         
-        self.story.append(PageBreak())
+        self.story.append(_PAGE_BREAK)
     
     def _add_conclusion(self):
         """Section 11: Conclusion."""
@@ -1228,8 +1330,8 @@ class QuantumNetworkTechnicalReport:
         
         # Acknowledgments
         self.story.append(Spacer(1, 0.3*inch))
-        self.story.append(Paragraph("<b>Acknowledgments</b>", self.styles['SubsectionHeader']))
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph("<b>Acknowledgments</b>", 'SubsectionHeader'))
+        self.story.append(self._paragraph(
             """
             This project builds on foundational work in quantum information theory, particularly 
             the BBPSSW protocol (Bennett, Brassard, Popescu, Schumacher, Smolin, Wootters, 1996) 
@@ -1237,17 +1339,32 @@ class QuantumNetworkTechnicalReport:
             Implementation uses Qiskit (IBM Quantum), LangGraph (LangChain), and standard Python 
             scientific computing libraries.
             """,
-            self.styles['BodyJustify']
+            'BodyJustify'
         ))
 
 
+def build_report(output_filename):
+    """
+    Build the report in the current process and return the PDF bytes.
+    
+    Module-level (so picklable) for servers that keep doc.build off their
+    event loop, e.g. ``ProcessPoolExecutor().submit(build_report, fname)``.
+    """
+    return QuantumNetworkTechnicalReport(output_filename=output_filename).generate_complete_report()
+
+
+_BAR = "=" * 70
+
+
 def main():
     """Generate the technical report."""
-    print("="*70)
-    print("Quantum Network Optimization - Technical Report Generator")
-    print("IonQ Hackathon 2026")
-    print("="*70)
-    print()
+    print("\n".join([
+        _BAR,
+        "Quantum Network Optimization - Technical Report Generator",
+        "IonQ Hackathon 2026",
+        _BAR,
+        "",
+    ]))
     
     # Create report generator
     report = QuantumNetworkTechnicalReport(
@@ -1255,24 +1372,26 @@ def main():
     )
     
     # Generate complete report
-    report.generate_complete_report()
+    pdf_bytes = report.generate_complete_report()
     
-    print()
-    print("="*70)
-    print("✓ Technical report generation complete!")
-    print("="*70)
-    print()
-    print(f"Output: {report.output_filename}")
-    print(f"Size: {os.path.getsize(report.output_filename) / 1024:.1f} KB")
-    print()
-    print("The report includes:")
-    print("  • Complete system architecture documentation")
-    print("  • Quantum distillation protocol details")
-    print("  • Resource management strategies")
-    print("  • LangGraph agent implementation")
-    print("  • Experimental results and validation")
-    print("  • Real-world applications and future work")
-    print()
+    print("\n".join([
+        "",
+        _BAR,
+        "✓ Technical report generation complete!",
+        _BAR,
+        "",
+        f"Output: {report.output_filename}",
+        f"Size: {len(pdf_bytes) / 1024:.1f} KB",
+        "",
+        "The report includes:",
+        "  • Complete system architecture documentation",
+        "  • Quantum distillation protocol details",
+        "  • Resource management strategies",
+        "  • LangGraph agent implementation",
+        "  • Experimental results and validation",
+        "  • Real-world applications and future work",
+        "",
+    ]))
 
 
 if __name__ == "__main__":
@@ -14,31 +14,22 @@ It does NOT implement actual quantum networking (which IBM doesn't support).
 
 from hardware.ibm_hardware import IBMQuantumHardwareValidator, plot_fidelity_comparison, save_validation_report
 import sys
-import os
+
+from config.ibm import get_ibm_config
 
 # ============================================================================
 # Configuration
 # ============================================================================
 
-# Try to import from config file, fall back to environment variable or prompt
-try:
-    from config.ibm_config import (
-        IBM_API_TOKEN,
-        IBM_HUB,
-        IBM_GROUP,
-        IBM_PROJECT,
-        DEFAULT_SHOTS,
-        USE_REAL_HARDWARE,
-        MIN_QUBITS
-    )
-    print("✓ Loaded configuration from ibm_config.py")
-except ImportError:
-    print("⚠️  ibm_config.py not found. Checking environment variables...")
-    
-    # Try environment variable
-    IBM_API_TOKEN = os.environ.get('IBM_QUANTUM_TOKEN')
-    
-    if not IBM_API_TOKEN:
+# Settings come from config/ibm_config.py or the environment and are only
+# resolved when main() runs, so importing this module stays cheap.
+
+
+def load_config():
+    """Resolve IBM Quantum settings, exiting with instructions if no token is set."""
+    try:
+        return get_ibm_config()
+    except RuntimeError:
         print("\n" + "="*70)
         print("IBM Quantum API Token Required")
         print("="*70)
@@ -46,23 +37,10 @@ except ImportError:
         print("1. Go to https://quantum.ibm.com/account")
         print("2. Click 'Copy token'")
         print("3. Create ibm_config.py from ibm_config_template.py")
-        print("   OR set environment variable: export IBM_QUANTUM_TOKEN='your_token'")
+        print("   OR set environment variable: export IBM_API_TOKEN='your_token'")
         print("\nFor security, the token is NOT hardcoded in this script.")
         print("="*70)
         sys.exit(1)
-    
-    # Default values
-    IBM_HUB = "ibm-q"
-    IBM_GROUP = "open"
-    IBM_PROJECT = "main"
-    DEFAULT_SHOTS = 4096
-    USE_REAL_HARDWARE = False
-    MIN_QUBITS = 5
-    print("✓ Using environment variable IBM_QUANTUM_TOKEN")
-
-# Use configuration
-SHOTS = DEFAULT_SHOTS
-# Execution parameters can be overridden here if needed
 
 
 # ============================================================================
@@ -80,15 +58,18 @@ def main():
 ║                                                                      ║
 ╚══════════════════════════════════════════════════════════════════════╝
     """)
-    
+
+    config = load_config()
+    shots = config.default_shots
+
     # Step 1: Initialize validator
     print("\n[STEP 1] Initializing IBM Quantum connection...")
     try:
         validator = IBMQuantumHardwareValidator(
-            api_token=IBM_API_TOKEN,
-            hub=IBM_HUB,
-            group=IBM_GROUP,
-            project=IBM_PROJECT
+            api_token=config.token,
+            hub=config.hub,
+            group=config.group,
+            project=config.project
         )
     except Exception as e:
         print(f"✗ Failed to initialize: {e}")
@@ -102,8 +83,8 @@ def main():
     print("\n[STEP 2] Selecting optimal backend...")
     try:
         backend_info = validator.select_best_backend(
-            min_qubits=MIN_QUBITS,
-            simulator=not USE_REAL_HARDWARE,
+            min_qubits=config.min_qubits,
+            simulator=not config.use_real_hardware,
             verbose=True
         )
     except Exception as e:
@@ -130,10 +111,10 @@ def main():
     
     # Step 4: Run validation
     print("\n[STEP 4] Running hardware validation...")
-    print(f"  Shots: {SHOTS}")
+    print(f"  Shots: {shots}")
     print(f"  Backend: {backend_info['name']}")
     
-    if USE_REAL_HARDWARE:
+    if config.use_real_hardware:
         print("\n⚠️  WARNING: Using real quantum hardware")
         print("  This will use queue time and may take several minutes.")
         response = input("  Continue? (yes/no): ")
@@ -143,7 +124,7 @@ def main():
     
     try:
         report = validator.run_hardware_validation(
-            shots=SHOTS,
+            shots=shots,
             compare_with_simulation=True,
             verbose=True
         )
@@ -175,7 +156,7 @@ def main():
     print("SUMMARY")
     print("="*70)
     print(f"\nBackend: {backend_info['name']}")
-    print(f"Shots: {SHOTS}")
+    print(f"Shots: {shots}")
     print(f"\nResults:")
     print(f"  Hardware fidelity: {hardware_fid['fidelity']:.4f} ± {hardware_fid['error']:.4f}")
     print(f"  Post-selection success: {report['hardware_results']['post_selection']['success_probability']:.2%}")
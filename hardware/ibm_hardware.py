@@ -22,7 +22,7 @@ Phases:
 5. Integration with existing simulation framework
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile, qpy
 from qiskit.circuit.library import Initialize
 from qiskit.quantum_info import Statevector, DensityMatrix, state_fidelity
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler, Session
@@ -34,9 +34,65 @@ from qiskit_aer.noise import NoiseModel
 import numpy as np
 from typing import Tuple, Dict, List, Optional, Any
 from datetime import datetime
+from functools import lru_cache
+import io
 import time
 
 
+# ============================================================================
+# Transpilation (shared by hardware execution and local simulation)
+# ============================================================================
+
+def _backend_key(backend) -> Tuple[str, str]:
+    """(name, version) identifying a backend's target across backend instances."""
+    return backend.name, str(getattr(backend, "backend_version", ""))
+
+
+# ((name, version), optimization_level) -> preset pass manager; the pass
+# manager holds the backend's target, not the backend or its Runtime service
+_pass_managers: Dict[Tuple[Tuple[str, str], int], Any] = {}
+
+
+def _pass_manager(backend, optimization_level: int):
+    """Preset pass manager for a backend, built once per (name, version, level)."""
+    key = (_backend_key(backend), optimization_level)
+    pass_manager = _pass_managers.get(key)
+    if pass_manager is None:
+        pass_manager = _pass_managers[key] = generate_preset_pass_manager(
+            optimization_level=optimization_level,
+            backend=backend,
+            seed_transpiler=42
+        )
+    return pass_manager
+
+
+@lru_cache(maxsize=64)
+def _transpile_cached(circuit_qpy: bytes, backend_key: Tuple[str, str], optimization_level: int) -> QuantumCircuit:
+    """Transpile a QPY-serialized circuit; identical circuits are transpiled once per backend key."""
+    circuit = qpy.load(io.BytesIO(circuit_qpy))[0]
+    return _pass_managers[(backend_key, optimization_level)].run(circuit)
+
+
+def transpile_for_backend(
+    circuit: QuantumCircuit,
+    backend,
+    optimization_level: int = 3
+) -> QuantumCircuit:
+    """
+    Transpile a circuit for a backend, reusing earlier results.
+    
+    Circuits are keyed by their QPY serialization (ignoring the name) and
+    the backend by (name, version), so a rebuilt copy of the same circuit,
+    or a new instance of the same backend, hits the cache. Returns a copy.
+    """
+    # Registers the pass manager that _transpile_cached looks up by key
+    _pass_manager(backend, optimization_level)
+    buffer = io.BytesIO()
+    qpy.dump(circuit.copy(name="circuit"), buffer)
+    transpiled = _transpile_cached(buffer.getvalue(), _backend_key(backend), optimization_level)
+    return transpiled.copy(name=circuit.name)
+
+
 class IBMQuantumHardwareValidator:
     """
     Validates entanglement distillation circuits on IBM Quantum hardware.
@@ -384,6 +440,40 @@ class IBMQuantumHardwareValidator:
     # PHASE 3: Execution via Qiskit Runtime
     # ========================================================================
     
+    def _run_batch(
+        self,
+        transpiled: List[QuantumCircuit],
+        shots: int,
+        verbose: bool
+    ) -> List[Dict[str, int]]:
+        """
+        Run already-transpiled circuits as one job and return their counts in order.
+        
+        On Runtime the circuits go out as one Sampler call (one PUB per circuit)
+        in a single Session, so they share one queue wait.
+        """
+        if isinstance(self.backend, AerSimulator):
+            # Local simulation
+            result = self.backend.run(transpiled, shots=shots).result()
+            return [result.get_counts(i) for i in range(len(transpiled))]
+        
+        # Real hardware via Runtime
+        with Session(service=self.service, backend=self.backend) as session:
+            sampler = Sampler(session=session)
+            
+            # Run circuits
+            job = sampler.run(transpiled, shots=shots)
+            
+            if verbose:
+                print(f"  Job ID: {job.job_id()}")
+                print(f"  Status: {job.status()}")
+            
+            # Wait for result
+            result = job.result()
+        
+        # Extract counts from each PubResult
+        return [pub_result.data.meas.get_counts() for pub_result in result]
+    
     def execute_on_hardware(
         self,
         circuit: QuantumCircuit,
@@ -403,59 +493,57 @@ class IBMQuantumHardwareValidator:
         Returns:
             Execution results dictionary
         """
+        return self.execute_multiple_circuits(
+            {'circuit': circuit},
+            shots=shots,
+            optimization_level=optimization_level,
+            verbose=verbose
+        )['circuit']
+    
+    def execute_multiple_circuits(
+        self,
+        circuits: Dict[str, QuantumCircuit],
+        shots: int = 4096,
+        optimization_level: int = 3,
+        verbose: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute multiple circuits on hardware as a single batched job.
+        
+        Args:
+            circuits: Dictionary of {name: circuit}
+            shots: Number of shots per circuit
+            optimization_level: Transpiler optimization level
+            verbose: Print execution information
+            
+        Returns:
+            Dictionary of {name: results}; timings are for the whole batch
+        """
         if self.backend is None:
             raise RuntimeError("No backend selected. Call select_best_backend() first.")
         
         start_time = time.time()
         
-        # Transpile circuit for backend
+        # Transpile circuits for backend
         if verbose:
-            print(f"\nTranspiling circuit for {self.backend.name}...")
+            print(f"\nTranspiling {len(circuits)} circuit(s) for {self.backend.name}...")
         
-        pm = generate_preset_pass_manager(
-            optimization_level=optimization_level,
-            backend=self.backend
-        )
-        transpiled = pm.run(circuit)
+        transpiled = {
+            name: transpile_for_backend(circuit, self.backend, optimization_level)
+            for name, circuit in circuits.items()
+        }
         
         transpile_time = time.time() - start_time
         
         if verbose:
-            print(f"  Original depth: {circuit.depth()}")
-            print(f"  Transpiled depth: {transpiled.depth()}")
+            for name, circuit in circuits.items():
+                print(f"  {name}: depth {circuit.depth()} -> {transpiled[name].depth()}")
             print(f"  Transpile time: {transpile_time:.2f}s")
-            print(f"\nSubmitting to {self.backend.name} ({shots} shots)...")
+            print(f"\nSubmitting to {self.backend.name} ({len(circuits)} circuit(s), {shots} shots each)...")
         
-        # Execute using Sampler
+        # Execute all circuits in one job
         execution_start = time.time()
-        
-        if isinstance(self.backend, AerSimulator):
-            # Local simulation
-            from qiskit import transpile as basic_transpile
-            transpiled_sim = basic_transpile(circuit, self.backend)
-            job = self.backend.run(transpiled_sim, shots=shots)
-            result = job.result()
-            counts = result.get_counts()
-            
-        else:
-            # Real hardware via Runtime
-            with Session(service=self.service, backend=self.backend) as session:
-                sampler = Sampler(session=session)
-                
-                # Run circuit
-                job = sampler.run([transpiled], shots=shots)
-                
-                if verbose:
-                    print(f"  Job ID: {job.job_id()}")
-                    print(f"  Status: {job.status()}")
-                
-                # Wait for result
-                result = job.result()
-                
-                # Extract counts from PubResult
-                pub_result = result[0]
-                counts = pub_result.data.meas.get_counts()
-        
+        all_counts = self._run_batch(list(transpiled.values()), shots, verbose)
         execution_time = time.time() - execution_start
         total_time = time.time() - start_time
         
@@ -464,55 +552,22 @@ class IBMQuantumHardwareValidator:
             print(f"  Execution time: {execution_time:.2f}s")
             print(f"  Total time: {total_time:.2f}s")
         
+        timestamp = datetime.now().isoformat()
         return {
-            'counts': counts,
-            'shots': shots,
-            'backend': self.backend.name,
-            'transpiled_depth': transpiled.depth(),
-            'original_depth': circuit.depth(),
-            'transpile_time': transpile_time,
-            'execution_time': execution_time,
-            'total_time': total_time,
-            'timestamp': datetime.now().isoformat()
+            name: {
+                'counts': counts,
+                'shots': shots,
+                'backend': self.backend.name,
+                'transpiled_depth': transpiled[name].depth(),
+                'original_depth': circuit.depth(),
+                'transpile_time': transpile_time,
+                'execution_time': execution_time,
+                'total_time': total_time,
+                'timestamp': timestamp
+            }
+            for (name, circuit), counts in zip(circuits.items(), all_counts)
         }
     
-    def execute_multiple_circuits(
-        self,
-        circuits: Dict[str, QuantumCircuit],
-        shots: int = 4096,
-        optimization_level: int = 3,
-        verbose: bool = True
-    ) -> Dict[str, Dict[str, Any]]:
-        """
-        Execute multiple circuits on hardware (batch execution).
-        
-        Args:
-            circuits: Dictionary of {name: circuit}
-            shots: Number of shots per circuit
-            optimization_level: Transpiler optimization level
-            verbose: Print execution information
-            
-        Returns:
-            Dictionary of {name: results}
-        """
-        results = {}
-        
-        for name, circuit in circuits.items():
-            if verbose:
-                print(f"\n{'='*60}")
-                print(f"Executing circuit: {name}")
-                print(f"{'='*60}")
-            
-            result = self.execute_on_hardware(
-                circuit,
-                shots=shots,
-                optimization_level=optimization_level,
-                verbose=verbose
-            )
-            results[name] = result
-        
-        return results
-    
     # ========================================================================
     # PHASE 4: Fidelity Estimation
     # ========================================================================
@@ -771,16 +826,17 @@ class IBMQuantumHardwareValidator:
             # Run simulation
             simulator = AerSimulator(noise_model=noise_model) if noise_model else AerSimulator()
             
-            sim_results = {}
-            for name, circuit in fidelity_circuits.items():
-                from qiskit import transpile as basic_transpile
-                transpiled = basic_transpile(circuit, simulator)
-                job = simulator.run(transpiled, shots=shots)
-                result = job.result()
-                sim_results[name] = {
-                    'counts': result.get_counts(),
+            # One transpile call and one job for all measurement circuits
+            names = list(fidelity_circuits)
+            transpiled = transpile(list(fidelity_circuits.values()), simulator)
+            result = simulator.run(transpiled, shots=shots).result()
+            sim_results = {
+                name: {
+                    'counts': result.get_counts(i),
                     'shots': shots
                 }
+                for i, name in enumerate(names)
+            }
             
             # Estimate fidelity from simulation
             sim_fidelity = self.estimate_bell_state_fidelity(
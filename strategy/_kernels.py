@@ -0,0 +1,88 @@
+"""
+Compiled edge-scoring kernel.
+
+Scores the struct-of-arrays view from build_edge_arrays() and picks the
+best edge in a single pass. Uses numba when installed (compiled once and
+cached on disk); otherwise falls back to an equivalent NumPy version.
+
+fastmath is deliberately off: reassociating the priority sum could flip
+ties and change which edge is selected compared to score_edge().
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def edge_priorities(utility, bonus, difficulty, success_prob, expected_cost, has_target,
+                    wu, wd, wc, wp):
+    """
+    Vectorized priorities for all edges.
+
+    Returns:
+        (priority, cost) arrays; edges without a target node score 0 at cost 0.
+    """
+    expected_utility = (utility + bonus * 0.5) * success_prob
+    roi = expected_utility / np.maximum(1.0, expected_cost)
+    priority = wu * utility + wp * success_prob * 10 + -wd * difficulty + -wc * expected_cost + roi * 2.0
+    return np.where(has_target, priority, 0.0), np.where(has_target, expected_cost, 0.0)
+
+
+def _pick_best_edge_numpy(utility, bonus, difficulty, success_prob, expected_cost, has_target,
+                          wu, wd, wc, wp, current_budget, budget_threshold):
+    """NumPy fallback with the same contract as the compiled kernel."""
+    priority, cost = edge_priorities(utility, bonus, difficulty, success_prob, expected_cost,
+                                     has_target, wu, wd, wc, wp)
+
+    if priority.shape[0] == 0:
+        return -1, -1
+
+    affordable = current_budget - cost >= budget_threshold
+    best_affordable = int(np.argmax(np.where(affordable, priority, -np.inf))) if affordable.any() else -1
+    return best_affordable, int(np.argmax(priority))
+
+
+def _pick_best_edge_loop(utility, bonus, difficulty, success_prob, expected_cost, has_target,
+                         wu, wd, wc, wp, current_budget, budget_threshold):
+    """
+    Single-pass score + argmax.
+
+    Returns:
+        (best_affordable, best_any) indices; -1 when there is no such edge.
+        Ties resolve to the lowest index, matching the stable sort in rank_edges.
+    """
+    best_affordable = -1
+    best_affordable_priority = 0.0
+    best_any = -1
+    best_any_priority = 0.0
+
+    for i in range(utility.shape[0]):
+        if has_target[i]:
+            cost = expected_cost[i]
+            expected_utility = (utility[i] + bonus[i] * 0.5) * success_prob[i]
+            roi = expected_utility / max(1.0, cost)
+            priority = (wu * utility[i] + wp * success_prob[i] * 10 + -wd * difficulty[i]
+                        + -wc * cost + roi * 2.0)
+        else:
+            cost = 0.0
+            priority = 0.0
+
+        if best_any < 0 or priority > best_any_priority:
+            best_any = i
+            best_any_priority = priority
+        if current_budget - cost >= budget_threshold:
+            if best_affordable < 0 or priority > best_affordable_priority:
+                best_affordable = i
+                best_affordable_priority = priority
+
+    return best_affordable, best_any
+
+
+if HAS_NUMBA:
+    pick_best_edge = njit(cache=True)(_pick_best_edge_loop)
+else:
+    pick_best_edge = _pick_best_edge_numpy
@@ -24,15 +24,15 @@ For LLM-based reasoning, see langgraph_agent.py (requires OpenAI API key).
 For modular architecture, see langgraph_deterministic_agent.py (recommended).
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass
 import numpy as np
 
 from core.client import GameClient
 from distillation.distillation import (
-    create_bbpssw_circuit,
-    create_dejmps_circuit,
-    create_adaptive_distillation_circuit,
+    get_circuit_template,
     estimate_success_probability,
     estimate_output_fidelity
 )
@@ -47,8 +47,31 @@ from distillation.simulator import (
     estimate_input_noise_from_difficulty
 )
 
+# Rate-limited (HTTP 429) claims are retried, waiting CLAIM_BACKOFF * 2**i seconds
+CLAIM_RETRIES_ON_429 = 3
+CLAIM_BACKOFF = 0.5
 
-@dataclass
+# Progress output templates (filled with format_map, only when verbose)
+_SUMMARY_TMPL = "\n".join([
+    "",
+    "=" * 60,
+    "Agent Execution Complete",
+    "=" * 60,
+    "Iterations: {iterations}",
+    "Successful claims: {successful_claims}",
+    "Failed attempts: {failed_attempts}",
+    "Final score: {final_score}",
+    "Final budget: {final_budget}",
+    "Owned nodes: {owned_nodes}",
+    "Owned edges: {owned_edges}",
+    "=" * 60,
+])
+_SKIPPED_TMPL = "[{iteration}] Skipped {edge}: {reason}"
+_CLAIMED_TMPL = "[{iteration}] ✓ Claimed {edge} (priority={priority:.2f}, ROI={roi:.2f}, {protocol}, {pairs} pairs)"
+_FAILED_TMPL = "[{iteration}] ✗ Failed {edge}: {error}"
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for the autonomous agent."""
     # Strategy weights
@@ -68,10 +91,14 @@ class AgentConfig:
     
     # Protocol selection
     prefer_dejmps: bool = False  # Prefer DEJMPS over BBPSSW
+    claim_by_protocol: bool = False  # Name the protocol instead of uploading QASM
     
     # Adaptive behavior
     adaptive_risk: bool = True  # Adjust risk based on budget
     adaptive_pairs: bool = True  # Adjust bell pairs based on attempts
+    
+    # Concurrency (keep within the server's rate limit)
+    max_concurrent_claims: int = 1  # >1 also claims independent runner-up edges in parallel
 
 
 class QuantumNetworkAgent:
@@ -121,12 +148,29 @@ class QuantumNetworkAgent:
         else:
             self.simulator = None
         
+        # Claims go out over the client's pooled session, so threads reuse sockets
+        if self.config.max_concurrent_claims > 1:
+            self._claim_pool = ThreadPoolExecutor(max_workers=self.config.max_concurrent_claims)
+        else:
+            self._claim_pool = None
+        
         # State tracking
         self.initial_budget: Optional[int] = None
         self.iteration_count = 0
         self.successful_claims = 0
         self.failed_attempts = 0
     
+    def close(self) -> None:
+        """Shut down the concurrent claim pool, if any (waits for in-flight claims)."""
+        if self._claim_pool is not None:
+            self._claim_pool.shutdown(wait=True)
+    
+    def __enter__(self) -> "QuantumNetworkAgent":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def select_protocol(
         self,
         edge_score: EdgeScore,
@@ -180,7 +224,12 @@ class QuantumNetworkAgent:
         num_bell_pairs: int
     ) -> Tuple[Any, int]:
         """
-        Create distillation circuit for chosen protocol.
+        Distillation circuit for chosen protocol.
+        
+        Returns the shared template for (protocol, num_bell_pairs), so it must
+        not be modified; reusing the object lets the client skip QASM
+        serialization on repeated claims. "adaptive" and unknown protocols
+        use BBPSSW (what adaptive picks for depolarizing noise).
         
         Args:
             protocol: Protocol name
@@ -189,15 +238,7 @@ class QuantumNetworkAgent:
         Returns:
             (circuit, flag_bit)
         """
-        if protocol == "dejmps":
-            return create_dejmps_circuit(num_bell_pairs)
-        elif protocol == "bbpssw":
-            return create_bbpssw_circuit(num_bell_pairs)
-        elif protocol == "adaptive":
-            return create_adaptive_distillation_circuit(num_bell_pairs)
-        else:
-            # Default to BBPSSW
-            return create_bbpssw_circuit(num_bell_pairs)
+        return get_circuit_template(protocol, num_bell_pairs)
     
     def attempt_edge_claim(
         self,
@@ -223,9 +264,69 @@ class QuantumNetworkAgent:
         Returns:
             Result dictionary with success status and metadata
         """
-        status = self.client.get_status()
+        # Nothing has been submitted since run_iteration fetched the status
+        status = self.client.get_status(fresh=False)
         current_budget = status.get('budget', 0)
         
+        plan = self._plan_claim(edge_score, attempt_number, current_budget)
+        if plan.get('skipped'):
+            return plan
+        
+        try:
+            response = self._submit_claim(plan)
+        except Exception as e:
+            return self._claim_error(edge_score, e)
+        return self._record_claim(plan, response)
+    
+    def attempt_edge_claims(
+        self,
+        attempts: List[Tuple[EdgeScore, int]],
+        current_budget: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Attempt several independent edges, submitting the claims concurrently.
+        
+        Planning (budget checks, circuits, simulation) runs in order and
+        reserves each planned claim's pairs from the budget seen by the next,
+        so the batch never overspends. Only the server round-trips overlap.
+        
+        Args:
+            attempts: (edge_score, attempt_number) pairs, best first
+            current_budget: Budget from this iteration's status
+            
+        Returns:
+            One result dictionary per attempt, in input order
+        """
+        plans = []
+        for edge_score, attempt_number in attempts:
+            plan = self._plan_claim(edge_score, attempt_number, current_budget)
+            if not plan.get('skipped'):
+                current_budget -= plan['num_bell_pairs']
+            plans.append(plan)
+        
+        submitted = [plan for plan in plans if not plan.get('skipped')]
+        futures = {id(plan): self._claim_pool.submit(self._submit_claim, plan) for plan in submitted}
+        
+        results = []
+        for plan in plans:
+            if plan.get('skipped'):
+                results.append(plan)
+                continue
+            try:
+                response = futures[id(plan)].result()
+            except Exception as e:
+                results.append(self._claim_error(plan['edge_score'], e))
+                continue
+            results.append(self._record_claim(plan, response))
+        return results
+    
+    def _plan_claim(
+        self,
+        edge_score: EdgeScore,
+        attempt_number: int,
+        current_budget: int
+    ) -> Dict[str, Any]:
+        """Budget check, protocol, pair count, circuit and simulation for one claim (skip result if rejected)."""
         # Check if we should attempt
         should_attempt, reason = self.budget_manager.should_attempt_edge(
             edge_score, current_budget
@@ -255,7 +356,7 @@ class QuantumNetworkAgent:
             input_noise = estimate_input_noise_from_difficulty(edge_score.difficulty)
             
             should_submit, sim_reason, sim_results = self.simulator.should_submit(
-                circuit, flag_bit, num_bell_pairs, edge_score.threshold, input_noise
+                circuit, flag_bit, num_bell_pairs, edge_score.threshold, input_noise, protocol
             )
             
             if not should_submit:
@@ -267,45 +368,69 @@ class QuantumNetworkAgent:
                     'simulation': sim_results
                 }
         
-        # Submit to server
-        try:
-            result = self.client.claim_edge(
-                edge_score.edge_id,
-                circuit,
-                flag_bit,
-                num_bell_pairs
-            )
-            
-            success = result.get('ok', False)
-            
-            # Record attempt
-            actual_cost = num_bell_pairs if success else 0
-            self.budget_manager.record_attempt(
-                edge_score.edge_id, success, actual_cost
-            )
-            
-            if success:
-                self.successful_claims += 1
-                self.budget_manager.reset_edge_attempts(edge_score.edge_id)
+        return {
+            'edge_score': edge_score,
+            'protocol': protocol,
+            'num_bell_pairs': num_bell_pairs,
+            'circuit': circuit,
+            'flag_bit': flag_bit
+        }
+    
+    def _submit_claim(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit a planned claim, backing off while the server is rate limiting (HTTP 429)."""
+        for retry in range(CLAIM_RETRIES_ON_429 + 1):
+            if self.config.claim_by_protocol:
+                result = self.client.claim_edge_by_protocol(
+                    plan['edge_score'].edge_id,
+                    plan['protocol'],
+                    plan['num_bell_pairs']
+                )
             else:
-                self.failed_attempts += 1
-            
-            return {
-                'success': success,
-                'skipped': False,
-                'edge': edge_score.edge_id,
-                'protocol': protocol,
-                'num_bell_pairs': num_bell_pairs,
-                'server_response': result
-            }
+                result = self.client.claim_edge(
+                    plan['edge_score'].edge_id,
+                    plan['circuit'],
+                    plan['flag_bit'],
+                    plan['num_bell_pairs']
+                )
+            if result.get('error', {}).get('code') != "RATE_LIMITED" or retry == CLAIM_RETRIES_ON_429:
+                return result
+            time.sleep(CLAIM_BACKOFF * 2 ** retry)
+    
+    def _record_claim(self, plan: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a submitted claim's outcome and build its result dictionary."""
+        edge_score = plan['edge_score']
+        num_bell_pairs = plan['num_bell_pairs']
+        success = result.get('ok', False)
+        
+        # Record attempt
+        actual_cost = num_bell_pairs if success else 0
+        self.budget_manager.record_attempt(
+            edge_score.edge_id, success, actual_cost
+        )
         
-        except Exception as e:
-            return {
-                'success': False,
-                'skipped': False,
-                'error': str(e),
-                'edge': edge_score.edge_id
-            }
+        if success:
+            self.successful_claims += 1
+            self.budget_manager.reset_edge_attempts(edge_score.edge_id)
+        else:
+            self.failed_attempts += 1
+        
+        return {
+            'success': success,
+            'skipped': False,
+            'edge': edge_score.edge_id,
+            'protocol': plan['protocol'],
+            'num_bell_pairs': num_bell_pairs,
+            'server_response': result
+        }
+    
+    @staticmethod
+    def _claim_error(edge_score: EdgeScore, error: Exception) -> Dict[str, Any]:
+        return {
+            'success': False,
+            'skipped': False,
+            'error': str(error),
+            'edge': edge_score.edge_id
+        }
     
     def run_iteration(self) -> Dict[str, Any]:
         """
@@ -338,8 +463,8 @@ class QuantumNetworkAgent:
                 current_budget, self.initial_budget
             )
         
-        # Get claimable edges
-        claimable_edges = self.client.get_claimable_edges()
+        # Get claimable edges (from the status fetched above)
+        claimable_edges = self.client.get_claimable_edges(status)
         
         if not claimable_edges:
             return {
@@ -366,8 +491,16 @@ class QuantumNetworkAgent:
         # Get attempt count for this edge
         attempt_number = self.budget_manager.get_attempt_count(best_edge.edge_id)
         
-        # Attempt to claim
-        result = self.attempt_edge_claim(best_edge, attempt_number)
+        # Attempt to claim (alongside independent runner-ups when concurrent)
+        extra_edges = self._independent_edges(best_edge, claimable_edges, graph, status)
+        if extra_edges:
+            attempts = [(best_edge, attempt_number)] + [
+                (edge, self.budget_manager.get_attempt_count(edge.edge_id)) for edge in extra_edges
+            ]
+            result, *extra_results = self.attempt_edge_claims(attempts, current_budget)
+        else:
+            result = self.attempt_edge_claim(best_edge, attempt_number)
+            attempts, extra_results = [], []
         
         return {
             'iteration': self.iteration_count,
@@ -377,9 +510,52 @@ class QuantumNetworkAgent:
             'roi': best_edge.roi,
             'attempt_number': attempt_number,
             'result': result,
+            'concurrent': [
+                {
+                    'edge': edge.edge_id,
+                    'priority': edge.priority,
+                    'roi': edge.roi,
+                    'attempt_number': attempt,
+                    'result': extra
+                }
+                for (edge, attempt), extra in zip(attempts[1:], extra_results)
+            ],
             'budget': current_budget
         }
     
+    def _independent_edges(
+        self,
+        best_edge: EdgeScore,
+        claimable_edges: List[Dict[str, Any]],
+        graph: Dict[str, Any],
+        status: Dict[str, Any]
+    ) -> List[EdgeScore]:
+        """
+        Runner-up edges that can be claimed in the same batch as best_edge.
+        
+        Edges are independent when they lead to different unowned nodes:
+        claiming one never changes whether another is claimable.
+        """
+        if self._claim_pool is None:
+            return []
+        
+        owned = set(status.get('owned_nodes', []))
+        
+        def target(edge_id):
+            n1, n2 = edge_id
+            return n2 if n1 in owned else n1
+        
+        targets = {target(best_edge.edge_id)}
+        extra = []
+        for edge in self.edge_strategy.rank_edges(claimable_edges, graph, status):
+            if len(extra) + 1 >= self.config.max_concurrent_claims:
+                break
+            node = target(edge.edge_id)
+            if node not in targets:
+                targets.add(node)
+                extra.append(edge)
+        return extra
+    
     def run_autonomous(
         self,
         max_iterations: int = 100,
@@ -438,17 +614,7 @@ class QuantumNetworkAgent:
         }
         
         if verbose:
-            print("\n" + "=" * 60)
-            print("Agent Execution Complete")
-            print("=" * 60)
-            print(f"Iterations: {summary['iterations']}")
-            print(f"Successful claims: {summary['successful_claims']}")
-            print(f"Failed attempts: {summary['failed_attempts']}")
-            print(f"Final score: {summary['final_score']}")
-            print(f"Final budget: {summary['final_budget']}")
-            print(f"Owned nodes: {summary['owned_nodes']}")
-            print(f"Owned edges: {summary['owned_edges']}")
-            print("=" * 60)
+            print(_SUMMARY_TMPL.format_map(summary))
         
         return summary
     
@@ -459,25 +625,35 @@ class QuantumNetworkAgent:
         
         if action == 'none':
             print(f"[{iteration}] No action: {result['reason']}")
-        else:
-            edge = result['edge']
-            priority = result.get('priority', 0)
-            roi = result.get('roi', 0)
-            attempt = result.get('attempt_number', 0)
-            claim_result = result.get('result', {})
+            return
+        
+        # The best edge first, then any claimed concurrently with it
+        for entry in [result] + result.get('concurrent', []):
+            edge = entry['edge']
+            priority = entry.get('priority', 0)
+            roi = entry.get('roi', 0)
+            attempt = entry.get('attempt_number', 0)
+            claim_result = entry.get('result', {})
             
             success = claim_result.get('success', False)
             skipped = claim_result.get('skipped', False)
             
             if skipped:
-                print(f"[{iteration}] Skipped {edge}: {claim_result.get('reason', 'Unknown')}")
+                print(_SKIPPED_TMPL.format_map({
+                    'iteration': iteration, 'edge': edge,
+                    'reason': claim_result.get('reason', 'Unknown')
+                }))
             elif success:
-                protocol = claim_result.get('protocol', 'unknown')
-                pairs = claim_result.get('num_bell_pairs', 0)
-                print(f"[{iteration}] ✓ Claimed {edge} (priority={priority:.2f}, ROI={roi:.2f}, {protocol}, {pairs} pairs)")
+                print(_CLAIMED_TMPL.format_map({
+                    'iteration': iteration, 'edge': edge, 'priority': priority, 'roi': roi,
+                    'protocol': claim_result.get('protocol', 'unknown'),
+                    'pairs': claim_result.get('num_bell_pairs', 0)
+                }))
             else:
-                error = claim_result.get('error', claim_result.get('reason', 'Failed'))
-                print(f"[{iteration}] ✗ Failed {edge}: {error}")
+                print(_FAILED_TMPL.format_map({
+                    'iteration': iteration, 'edge': edge,
+                    'error': claim_result.get('error', claim_result.get('reason', 'Failed'))
+                }))
 
 
 def create_default_agent(client: GameClient) -> QuantumNetworkAgent:
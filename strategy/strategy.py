@@ -5,10 +5,13 @@ Scores edges based on utility, difficulty, cost, and success probability.
 Constants are tuned for the game's mechanics—adjust if rules change.
 """
 
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
 
+from strategy._kernels import edge_priorities, pick_best_edge
+
 # Game constraints
 DIFFICULTY_SCALE = 10.0
 THRESHOLD_MIN = 0.5
@@ -18,6 +21,7 @@ THRESHOLD_MAX = 0.99
 BASE_SUCCESS_RATE = 0.7  # ~70% pass rate per ancilla measurement
 MIN_SUCCESS_PROB = 0.1
 MAX_SUCCESS_PROB = 0.95
+MIN_ATTEMPT_SUCCESS_PROB = 0.2  # BudgetManager skips edges below this
 
 # Cost estimation
 MIN_BELL_PAIRS = 2
@@ -26,10 +30,16 @@ BASE_COST = 2.0
 DIFFICULTY_COST_FACTOR = 3.0  # Higher difficulty → more pairs needed
 THRESHOLD_COST_FACTOR = 2.0   # Higher threshold → more pairs needed
 
+# Bell pair tiers: difficulty <= 3 / <= 6 / above start at 2 / 3 / 4 pairs,
+# and each threshold bound exceeded adds one more
+DIFFICULTY_TIER_BOUNDS = (3.0, 6.0)
+DIFFICULTY_TIER_PAIRS = np.array([2, 3, 4])
+THRESHOLD_TIER_BOUNDS = (0.85, 0.92)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EdgeScore:
-    """Scoring information for an edge."""
+    """Scoring information for an edge (immutable once scored)."""
     edge_id: Tuple[str, str]
     priority: float
     expected_utility: float
@@ -41,6 +51,90 @@ class EdgeScore:
     estimated_success_prob: float
 
 
+def build_edge_arrays(
+    claimable_edges: List[Dict[str, Any]],
+    graph: Dict[str, Any],
+    owned_nodes
+) -> Dict[str, Any]:
+    """
+    Struct-of-arrays view of claimable edges for vectorized scoring.
+    
+    Holds everything that does not depend on strategy weights: target node
+    utility/bonus, difficulty, threshold, and the derived success probability
+    and cost estimates (same formulas as the scalar helpers below).
+    
+    Args:
+        claimable_edges: List of claimable edges
+        graph: Full graph structure
+        owned_nodes: Owned node IDs (any container supporting `in`)
+        
+    Returns:
+        Dict of parallel numpy arrays plus 'edge_ids' (list of tuples)
+    """
+    owned = owned_nodes if isinstance(owned_nodes, (set, frozenset)) else set(owned_nodes)
+    nodes = {node['node_id']: node for node in graph.get('nodes', [])}
+    
+    n = len(claimable_edges)
+    edge_ids = []
+    utility = np.zeros(n)
+    bonus = np.zeros(n)
+    difficulty = np.empty(n)
+    threshold = np.empty(n)
+    has_target = np.zeros(n, dtype=bool)
+    
+    for i, edge in enumerate(claimable_edges):
+        n1, n2 = edge['edge_id']
+        edge_ids.append((n1, n2))
+        target_node = nodes.get(n2 if n1 in owned else n1)
+        if target_node:
+            has_target[i] = True
+            utility[i] = target_node.get('utility_qubits', 0)
+            bonus[i] = target_node.get('bonus_bell_pairs', 0)
+        difficulty[i] = edge.get('difficulty_rating', 5.0)
+        threshold[i] = edge.get('base_threshold', 0.9)
+    
+    success_prob = np.clip(
+        (1.0 - (difficulty / DIFFICULTY_SCALE) * 0.5) - (threshold - THRESHOLD_MIN) * 0.3,
+        MIN_SUCCESS_PROB, MAX_SUCCESS_PROB
+    )
+    expected_cost = np.clip(
+        BASE_COST
+        + (difficulty / DIFFICULTY_SCALE) * DIFFICULTY_COST_FACTOR
+        + ((threshold - THRESHOLD_MIN) * 2.0) * THRESHOLD_COST_FACTOR,
+        float(MIN_BELL_PAIRS), float(MAX_BELL_PAIRS)
+    )
+    
+    return {
+        'edge_ids': edge_ids,
+        'utility': utility,
+        'bonus': bonus,
+        'difficulty': difficulty,
+        'threshold': threshold,
+        'has_target': has_target,
+        'success_prob': success_prob,
+        'expected_cost': expected_cost,
+    }
+
+
+def edge_score_arrays(edge_scores: List[EdgeScore]) -> Dict[str, Any]:
+    """
+    Struct-of-arrays view of scored edges for BudgetManager.filter_edges.
+    
+    Args:
+        edge_scores: Scored edges
+        
+    Returns:
+        Dict of parallel numpy arrays plus 'edge_ids' (list of tuples)
+    """
+    return {
+        'edge_ids': [score.edge_id for score in edge_scores],
+        'expected_utility': np.array([score.expected_utility for score in edge_scores], dtype=float),
+        'expected_cost': np.array([score.expected_cost for score in edge_scores], dtype=float),
+        'roi': np.array([score.roi for score in edge_scores], dtype=float),
+        'success_prob': np.array([score.estimated_success_prob for score in edge_scores], dtype=float),
+    }
+
+
 class EdgeSelectionStrategy:
     """
     Multi-factor edge scoring.
@@ -76,7 +170,7 @@ class EdgeSelectionStrategy:
             edge: Edge information from graph
             graph: Full graph structure
             status: Current player status
-            owned_nodes: Set of owned node IDs
+            owned_nodes: Set (or frozenset) of owned node IDs
             
         Returns:
             EdgeScore with priority and metadata
@@ -160,33 +254,35 @@ class EdgeSelectionStrategy:
         Returns:
             List of EdgeScore objects, sorted by priority (descending)
         """
-        owned_nodes = set(status.get('owned_nodes', []))
+        edge_arrays = build_edge_arrays(claimable_edges, graph, status.get('owned_nodes', []))
         
-        scores = []
-        for edge in claimable_edges:
-            score = self.score_edge(edge, graph, status, owned_nodes)
-            scores.append(score)
+        # Score all edges at once, then sort by priority (highest first,
+        # stable on ties like list.sort)
+        priority, _ = self._priorities(edge_arrays)
+        order = np.argsort(-priority, kind='stable')
         
-        # Sort by priority (highest first)
-        scores.sort(key=lambda s: s.priority, reverse=True)
-        
-        return scores
+        return [self.edge_score_at(edge_arrays, int(i)) for i in order]
     
     def select_best_edge(
         self,
         claimable_edges: List[Dict[str, Any]],
         graph: Dict[str, Any],
         status: Dict[str, Any],
-        budget_threshold: int = 10
+        budget_threshold: int = 10,
+        edge_arrays: Optional[Dict[str, Any]] = None
     ) -> Optional[EdgeScore]:
         """
         Select the best edge to attempt, considering budget constraints.
         
+        Scores all edges in one compiled pass over the struct-of-arrays
+        layout; only the chosen edge is materialized as an EdgeScore.
+        
         Args:
             claimable_edges: List of claimable edges
             graph: Full graph structure
             status: Current player status
             budget_threshold: Minimum budget to reserve
+            edge_arrays: Precomputed build_edge_arrays() output (optional)
             
         Returns:
             Best EdgeScore or None if no good options
@@ -196,21 +292,125 @@ class EdgeSelectionStrategy:
         
         current_budget = status.get('budget', 0)
         
-        # Rank all edges
-        ranked = self.rank_edges(claimable_edges, graph, status)
+        if edge_arrays is None or len(edge_arrays['edge_ids']) != len(claimable_edges):
+            edge_arrays = build_edge_arrays(claimable_edges, graph, status.get('owned_nodes', []))
+        
+        # Compiled score + argmax over all edges (see strategy/_kernels.py)
+        best_affordable, best_any = pick_best_edge(
+            edge_arrays['utility'],
+            edge_arrays['bonus'],
+            edge_arrays['difficulty'],
+            edge_arrays['success_prob'],
+            edge_arrays['expected_cost'],
+            edge_arrays['has_target'],
+            float(self.utility_weight),
+            float(self.difficulty_weight),
+            float(self.cost_weight),
+            float(self.success_prob_weight),
+            float(current_budget),
+            float(budget_threshold)
+        )
         
-        # Filter by budget constraints
-        for score in ranked:
-            # Check if we have enough budget
-            if current_budget - score.expected_cost >= budget_threshold:
-                return score
+        # Highest priority among edges that keep the reserve
+        if best_affordable >= 0:
+            return self.edge_score_at(edge_arrays, best_affordable)
         
         # If no edges meet budget threshold, return best if we have any budget
-        if current_budget > 0 and ranked:
-            return ranked[0]
+        if current_budget > 0:
+            return self.edge_score_at(edge_arrays, best_any)
         
         return None
     
+    def rank_edge_indices(
+        self,
+        edge_arrays: Dict[str, Any],
+        current_budget: int,
+        budget_threshold: int = 10
+    ) -> np.ndarray:
+        """
+        Candidate order used by select_best_edge, as row indices.
+        
+        Edges that keep the reserve come first, by priority (stable on ties).
+        If none do, all edges are returned by priority as long as there is any
+        budget. The first entry is always what select_best_edge would return.
+        
+        Args:
+            edge_arrays: build_edge_arrays() output
+            current_budget: Current bell pair budget
+            budget_threshold: Minimum budget to reserve
+            
+        Returns:
+            Integer array of row indices (possibly empty)
+        """
+        priority, cost = self._priorities(edge_arrays)
+        order = np.argsort(-priority, kind='stable')
+        
+        affordable = current_budget - cost[order] >= budget_threshold
+        if affordable.any():
+            return order[affordable]
+        if current_budget > 0:
+            return order
+        return order[:0]
+    
+    def _priorities(self, edge_arrays: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized (priority, cost) for every row of build_edge_arrays() output."""
+        return edge_priorities(
+            edge_arrays['utility'],
+            edge_arrays['bonus'],
+            edge_arrays['difficulty'],
+            edge_arrays['success_prob'],
+            edge_arrays['expected_cost'],
+            edge_arrays['has_target'],
+            self.utility_weight,
+            self.difficulty_weight,
+            self.cost_weight,
+            self.success_prob_weight
+        )
+    
+    def edge_score_at(self, edge_arrays: Dict[str, Any], idx: int) -> EdgeScore:
+        """Materialize the EdgeScore for one row of build_edge_arrays() output."""
+        edge_id = edge_arrays['edge_ids'][idx]
+        difficulty = float(edge_arrays['difficulty'][idx])
+        threshold = float(edge_arrays['threshold'][idx])
+        
+        if not edge_arrays['has_target'][idx]:
+            return EdgeScore(
+                edge_id=edge_id,
+                priority=0.0,
+                expected_utility=0.0,
+                expected_cost=0.0,
+                roi=0.0,
+                difficulty=difficulty,
+                threshold=threshold,
+                target_node_utility=0,
+                estimated_success_prob=0.5
+            )
+        
+        utility = float(edge_arrays['utility'][idx])
+        success_prob = float(edge_arrays['success_prob'][idx])
+        expected_cost = float(edge_arrays['expected_cost'][idx])
+        expected_utility = (utility + float(edge_arrays['bonus'][idx]) * 0.5) * success_prob
+        roi = expected_utility / max(1.0, expected_cost)
+        priority = (
+            self.utility_weight * utility +
+            self.success_prob_weight * success_prob * 10 +
+            -self.difficulty_weight * difficulty +
+            -self.cost_weight * expected_cost +
+            roi * 2.0
+        )
+        
+        return EdgeScore(
+            edge_id=edge_id,
+            priority=priority,
+            expected_utility=expected_utility,
+            expected_cost=expected_cost,
+            roi=roi,
+            difficulty=difficulty,
+            threshold=threshold,
+            target_node_utility=int(utility),
+            estimated_success_prob=success_prob
+        )
+    
     def _get_node_info(self, node_id: str, graph: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get node information from graph."""
         for node in graph.get('nodes', []):
@@ -317,17 +517,17 @@ class BudgetManager:
         Returns:
             (should_attempt, reason)
         """
-        # Check retry limit
-        attempts = self.attempt_history.get(edge_score.edge_id, 0)
-        if attempts >= self.max_retries_per_edge:
-            return False, f"Max retries ({self.max_retries_per_edge}) reached"
+        # Cheapest checks first: float comparisons on the score, then the
+        # retry lookup (hashes the edge_id tuple). Reasons are only
+        # formatted on rejection.
+        cost = edge_score.expected_cost
         
         # Check budget constraint
-        if current_budget < edge_score.expected_cost + self.min_reserve:
-            return False, f"Insufficient budget (need {edge_score.expected_cost + self.min_reserve}, have {current_budget})"
+        if current_budget < cost + self.min_reserve:
+            return False, f"Insufficient budget (need {cost + self.min_reserve}, have {current_budget})"
         
         # Check expected value
-        expected_value = edge_score.expected_utility - edge_score.expected_cost
+        expected_value = edge_score.expected_utility - cost
         if expected_value <= 0:
             return False, f"Negative expected value ({expected_value:.2f})"
         
@@ -336,11 +536,40 @@ class BudgetManager:
             return False, f"ROI ({edge_score.roi:.2f}) below risk tolerance ({self.risk_tolerance})"
         
         # Check success probability
-        if edge_score.estimated_success_prob < 0.2:
+        if edge_score.estimated_success_prob < MIN_ATTEMPT_SUCCESS_PROB:
             return False, f"Success probability too low ({edge_score.estimated_success_prob:.2%})"
         
+        # Check retry limit
+        if self.attempt_history.get(edge_score.edge_id, 0) >= self.max_retries_per_edge:
+            return False, f"Max retries ({self.max_retries_per_edge}) reached"
+        
         return True, "Approved"
     
+    def filter_edges(self, arrays: Dict[str, Any], current_budget: int) -> np.ndarray:
+        """
+        Vectorized should_attempt_edge: the same checks for many edges at once.
+        
+        Args:
+            arrays: Output of edge_score_arrays()
+            current_budget: Current bell pair budget
+            
+        Returns:
+            Boolean mask, True where should_attempt_edge would approve
+        """
+        attempts = np.array(
+            [self.attempt_history.get(edge_id, 0) for edge_id in arrays['edge_ids']],
+            dtype=int
+        )
+        utility = arrays['expected_utility']
+        cost = arrays['expected_cost']
+        return (
+            (attempts < self.max_retries_per_edge)
+            & (current_budget >= cost + self.min_reserve)
+            & (utility - cost > 0)
+            & (arrays['roi'] >= self.risk_tolerance)
+            & (arrays['success_prob'] >= MIN_ATTEMPT_SUCCESS_PROB)
+        )
+    
     def record_attempt(
         self,
         edge_id: Tuple[str, str],
@@ -425,23 +654,13 @@ class AdaptiveDistillationPlanner:
         Returns:
             Number of bell pairs to use (2-8)
         """
-        # Base number from difficulty
-        if edge_score.difficulty <= 3:
-            base_pairs = 2
-        elif edge_score.difficulty <= 6:
-            base_pairs = 3
-        else:
-            base_pairs = 4
+        # Base number from difficulty and threshold tiers
+        base_pairs = int(DIFFICULTY_TIER_PAIRS[bisect_left(DIFFICULTY_TIER_BOUNDS, edge_score.difficulty)])
+        base_pairs += bisect_left(THRESHOLD_TIER_BOUNDS, edge_score.threshold)
         
         # Increase with attempt number (retry with more resources)
         pairs = base_pairs + attempt_number
         
-        # Threshold adjustment
-        if edge_score.threshold > 0.85:
-            pairs += 1
-        if edge_score.threshold > 0.92:
-            pairs += 1
-        
         # Budget constraint
         affordable_pairs = min(current_budget // 2, self.max_pairs)
         pairs = min(pairs, affordable_pairs)
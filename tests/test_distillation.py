@@ -11,13 +11,18 @@ Validates:
 import sys
 from qiskit import QuantumCircuit
 from distillation.distillation import (
+    analytical_depth,
     create_bbpssw_circuit,
     create_dejmps_circuit,
     create_adaptive_distillation_circuit,
     create_recursive_distillation_circuit,
+    get_circuit_template,
+    get_distillation_circuit,
+    get_circuit_depth,
     estimate_success_probability,
     estimate_output_fidelity
 )
+from distillation.simulator import DistillationSimulator
 
 
 def test_circuit_structure(circuit: QuantumCircuit, num_bell_pairs: int, name: str):
@@ -129,6 +134,34 @@ def test_adaptive():
     print("\n✓ All adaptive tests passed")
 
 
+def test_circuit_templates():
+    """Test that template copies match fresh builds and stay independent."""
+    print("\n" + "=" * 60)
+    print("Testing Circuit Templates")
+    print("=" * 60)
+    
+    for protocol, builder in [("bbpssw", create_bbpssw_circuit), ("dejmps", create_dejmps_circuit)]:
+        for N in [2, 3, 4]:
+            expected, expected_flag = builder(N)
+            first, flag_bit = get_distillation_circuit(protocol, N)
+            assert first == expected and flag_bit == expected_flag, f"{protocol} N={N} differs from builder"
+            
+            # Modifying one copy must not leak into the next
+            first.x(0)
+            second, _ = get_distillation_circuit(protocol, N)
+            assert second == expected, f"{protocol} N={N} template was modified"
+            assert second is not first, "Each call should return a new circuit"
+            
+            # Read-only callers share one template per (protocol, N)
+            template, _ = get_circuit_template(protocol, N)
+            assert template is get_circuit_template(protocol, N)[0], "Template should be shared"
+            assert template == expected and template is not second
+            assert get_circuit_depth(protocol, N) == expected.depth(), f"{protocol} N={N} depth differs"
+            assert analytical_depth(protocol, N) == expected.depth(), f"{protocol} N={N} depth formula differs"
+    
+    print("\n✓ All template tests passed")
+
+
 def test_estimates():
     """Test estimation functions."""
     print("\n" + "=" * 60)
@@ -155,10 +188,40 @@ def test_estimates():
             
             assert F_out >= F_in, "Output fidelity should be >= input"
             assert F_out <= 1.0, "Fidelity cannot exceed 1.0"
+            
+            F_dejmps = estimate_output_fidelity(F_in, N, "dejmps")
+            assert F_dejmps >= F_out - 1e-12, "DEJMPS should match or beat BBPSSW on Werner input"
+    
+    # Grid inputs come from the table, others from the recurrence; they agree
+    for protocol in ["bbpssw", "dejmps"]:
+        for N in [2, 4, 8]:
+            tabulated = estimate_output_fidelity(0.85, N, protocol)
+            computed = estimate_output_fidelity(0.85 + 1e-7, N, protocol)
+            assert abs(tabulated - computed) < 1e-6, f"{protocol} N={N} table mismatch"
     
     print("\n✓ All estimation tests passed")
 
 
+def test_simulator_matches_estimates():
+    """Simulator fidelity gate agrees with the planner's recurrence."""
+    print("\n" + "=" * 60)
+    print("Testing Simulator vs. Fidelity Estimates")
+    print("=" * 60)
+    
+    simulator = DistillationSimulator()
+    for protocol in ["bbpssw", "dejmps"]:
+        for noise in [0.05, 0.15, 0.35]:
+            for N in [2, 3, 4, 8]:
+                circuit, flag_bit = get_distillation_circuit(protocol, N)
+                simulated, _ = simulator.estimate_fidelity(circuit, flag_bit, N, noise, protocol=protocol)
+                expected = estimate_output_fidelity(1 - noise, N, protocol)
+                print(f"  {protocol} noise={noise:.2f}, N={N}: simulator={simulated:.3f}, estimate={expected:.3f}")
+                assert abs(simulated - expected) < 1e-12, \
+                    f"Simulator disagrees for {protocol} at noise={noise}, N={N}"
+    
+    print("\n✓ Simulator estimates match")
+
+
 def run_all_tests():
     """Run all test suites."""
     print("=" * 60)
@@ -169,7 +232,9 @@ def run_all_tests():
         test_bbpssw()
         test_dejmps()
         test_adaptive()
+        test_circuit_templates()
         test_estimates()
+        test_simulator_matches_estimates()
         
         print("\n" + "=" * 60)
         print("✓ ALL TESTS PASSED")
@@ -11,7 +11,7 @@ Tests all phases of the hardware validation system:
 
 import unittest
 import numpy as np
-from hardware.ibm_hardware import IBMQuantumHardwareValidator
+from hardware.ibm_hardware import IBMQuantumHardwareValidator, transpile_for_backend, _transpile_cached
 from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
 
@@ -357,6 +357,45 @@ class TestIBMHardwareIntegration(unittest.TestCase):
             print(f"  ⚠ Integration test skipped: {e}")
             print(f"    (This is expected if IBM Quantum credentials are not configured)")
 
+    
+    def test_07_transpile_cache(self):
+        """Test that identical circuits are transpiled once per backend."""
+        print("\n[TEST 7] Transpile Cache")
+        
+        simulator = AerSimulator()
+        
+        def bell_circuit():
+            qc = QuantumCircuit(2, 2)
+            qc.h(0)
+            qc.cx(0, 1)
+            qc.measure([0, 1], [0, 1])
+            return qc
+        
+        first = transpile_for_backend(bell_circuit(), simulator, optimization_level=3)
+        hits = _transpile_cached.cache_info().hits
+        
+        # A rebuilt circuit has a different auto-generated name but the same content
+        second = transpile_for_backend(bell_circuit(), simulator, optimization_level=3)
+        self.assertEqual(_transpile_cached.cache_info().hits, hits + 1,
+                         "Rebuilt circuit should be served from the cache")
+        self.assertIsNot(first, second, "Callers should get independent copies")
+        self.assertEqual(first.depth(), second.depth())
+        
+        # The cached circuit runs as-is on the backend it was transpiled for
+        counts = simulator.run(second, shots=200).result().get_counts()
+        self.assertEqual(sum(counts.values()), 200)
+        self.assertTrue(set(counts) <= {'00', '11'}, "Bell state should give |00⟩ or |11⟩")
+        
+        # A new instance of the same backend is keyed by name/version, not identity
+        hits = _transpile_cached.cache_info().hits
+        transpile_for_backend(bell_circuit(), AerSimulator(), optimization_level=3)
+        self.assertEqual(_transpile_cached.cache_info().hits, hits + 1,
+                         "New AerSimulator instance should be served from the cache")
+        
+        print(f"  ✓ Cache hit for rebuilt circuit (depth {second.depth()})")
+        print(f"  ✓ Cache hit for a new backend instance")
+        print(f"  ✓ Outcomes: {counts}")
+
 
 def run_tests():
     """Run all tests with detailed output."""
@@ -9,6 +9,9 @@ Validates:
 - No infinite loops
 """
 
+import dataclasses
+import itertools
+import pickle
 import sys
 from typing import Dict, Any
 from agentic.langgraph_deterministic_agent import (
@@ -18,10 +21,14 @@ from agentic.langgraph_deterministic_agent import (
     EdgeSelectionNode,
     ResourceAllocationNode,
     DistillationStrategyNode,
-    SimulationCheckNode
+    SimulationCheckNode,
+    ExecutionNode,
+    _claim_result,
+    _collect_claims
 )
 from strategy.strategy import EdgeSelectionStrategy, BudgetManager, AdaptiveDistillationPlanner, EdgeScore
 from distillation.simulator import DistillationSimulator
+from core.client import GameClient
 
 
 def test_state_initialization():
@@ -141,6 +148,80 @@ def test_edge_selection_node():
     return True
 
 
+def test_edge_selection_skip_advances():
+    """Test that a skipped edge moves selection to the next-ranked candidate."""
+    print("\n" + "=" * 60)
+    print("Testing Edge Selection Skip Advancement")
+    print("=" * 60)
+    
+    strategy = EdgeSelectionStrategy()
+    budget_manager = BudgetManager(min_reserve=10, max_retries_per_edge=3)
+    node = EdgeSelectionNode(strategy, budget_manager)
+    
+    state: AgentState = {
+        'current_budget': 75,
+        'current_score': 0,
+        'owned_nodes': ['A'],
+        'owned_edges': [],
+        'claimable_edges': [
+            {'edge_id': ('A', 'B'), 'difficulty_rating': 3.0, 'base_threshold': 0.85},
+            {'edge_id': ('A', 'C'), 'difficulty_rating': 2.0, 'base_threshold': 0.80}
+        ],
+        'graph': {
+            'nodes': [
+                {'node_id': 'A', 'utility_qubits': 10, 'bonus_bell_pairs': 5},
+                {'node_id': 'B', 'utility_qubits': 15, 'bonus_bell_pairs': 8},
+                {'node_id': 'C', 'utility_qubits': 12, 'bonus_bell_pairs': 4}
+            ],
+            'edges': []
+        },
+        'selected_edge': None,
+        'num_bell_pairs': 0,
+        'protocol': '',
+        'circuit': None,
+        'flag_bit': 0,
+        'estimated_fidelity': 0.0,
+        'estimated_success_prob': 0.0,
+        'should_submit': False,
+        'simulation_reason': '',
+        'execution_success': False,
+        'execution_response': {},
+        'iteration': 0,
+        'attempt_history': {},
+        'successful_claims': 0,
+        'failed_attempts': 0,
+        'initial_budget': 75,
+        'action': 'continue',
+        'stop_reason': ''
+    }
+    
+    first = strategy.select_best_edge(
+        state['claimable_edges'], state['graph'],
+        {'owned_nodes': state['owned_nodes'], 'budget': state['current_budget']}, 10
+    ).edge_id
+    print(f"  Top-ranked edge: {first}")
+    
+    # Exhaust retries on the top edge so the budget manager rejects it
+    budget_manager.attempt_history[first] = 3
+    result = node(state)
+    assert result['action'] == 'skip', "Should skip edge at retry limit"
+    
+    # Same claimable set: next pass should move to the other edge
+    state = {**state, **result, 'action': 'continue'}
+    result = node(state)
+    assert result['action'] == 'continue', "Should select the next candidate"
+    assert result['selected_edge'].edge_id != first, "Should not re-select the skipped edge"
+    print(f"✓ Advanced to next candidate: {result['selected_edge'].edge_id}")
+    
+    # Candidates exhausted: stop instead of looping
+    state = {**state, **result, 'action': 'continue'}
+    result = node(state)
+    assert result['action'] == 'stop', "Should stop once all candidates are used"
+    print(f"✓ Stops when candidates are exhausted: {result['stop_reason']}")
+    
+    return True
+
+
 def test_resource_allocation_node():
     """Test resource allocation node logic."""
     print("\n" + "=" * 60)
@@ -368,6 +449,8 @@ def test_control_flow():
             return {'budget': 5, 'score': 0, 'owned_nodes': ['A'], 'owned_edges': []}
         def get_claimable_edges(self):
             return []
+        def get_state_bundle(self):
+            return {'status': self.get_status(), 'claimable_edges': self.get_claimable_edges()}
     
     mock_client = MockClient()
     update_node = UpdateStateNode(budget_manager, config, mock_client)
@@ -411,11 +494,12 @@ def test_budget_constraints():
     assert not should_attempt, "Should reject when budget insufficient"
     print(f"✓ Rejects high-cost edge: {reason}")
     
-    # Test 2: Retry limit
-    edge_score.expected_cost = 3.0
+    # Test 2: Retry limit (an edge that passes every other check)
+    edge_score = dataclasses.replace(edge_score, expected_cost=3.0, roi=1.0)
     budget_manager.attempt_history[('A', 'B')] = 3  # Max retries reached
     should_attempt, reason = budget_manager.should_attempt_edge(edge_score, 75)
     assert not should_attempt, "Should reject when retry limit reached"
+    assert reason.startswith("Max retries"), f"Should be rejected on the retry limit, got: {reason}"
     print(f"✓ Enforces retry limit: {reason}")
     
     # Test 3: Valid attempt
@@ -470,6 +554,9 @@ def test_full_graph_execution():
                 ]
             return []  # No more edges after 2 iterations
         
+        def get_state_bundle(self):
+            return {'status': self.get_status(), 'claimable_edges': self.get_claimable_edges()}
+        
         def claim_edge(self, edge, circuit, flag_bit, num_bell_pairs):
             self.call_count += 1
             # Simulate successful claim
@@ -506,6 +593,238 @@ def test_full_graph_execution():
     return True
 
 
+def test_direct_executor_matches_pregel():
+    """Test that the direct executor and the LangGraph runtime agree."""
+    print("\n" + "=" * 60)
+    print("Testing Direct Executor vs Pregel")
+    print("=" * 60)
+
+    from agentic.langgraph_deterministic_agent import LangGraphQuantumAgent, LangGraphAgentConfig
+
+    class ChainMockClient:
+        def __init__(self):
+            self.budget = 60
+            self.score = 0
+            self.owned_nodes = ['A']
+            self.owned_edges = []
+
+        def get_status(self):
+            return {
+                'budget': self.budget,
+                'score': self.score,
+                'owned_nodes': list(self.owned_nodes),
+                'owned_edges': list(self.owned_edges)
+            }
+
+        def get_cached_graph(self):
+            return {
+                'nodes': [
+                    {'node_id': 'A', 'utility_qubits': 10, 'bonus_bell_pairs': 5},
+                    {'node_id': 'B', 'utility_qubits': 15, 'bonus_bell_pairs': 8},
+                    {'node_id': 'C', 'utility_qubits': 12, 'bonus_bell_pairs': 3}
+                ],
+                'edges': [
+                    {'edge_id': ('A', 'B'), 'difficulty_rating': 3.0, 'base_threshold': 0.85},
+                    {'edge_id': ('B', 'C'), 'difficulty_rating': 4.0, 'base_threshold': 0.85}
+                ]
+            }
+
+        def get_state_bundle(self):
+            owned = set(self.owned_nodes)
+            claimable = [
+                e for e in self.get_cached_graph()['edges']
+                if (e['edge_id'][0] in owned) != (e['edge_id'][1] in owned)
+            ]
+            return {'status': self.get_status(), 'claimable_edges': claimable}
+
+        def claim_edge(self, edge, circuit, flag_bit, num_bell_pairs):
+            self.budget -= num_bell_pairs
+            self.score += 10
+            self.owned_edges.append(edge)
+            self.owned_nodes.append(edge[1])
+            return {'ok': True}
+
+    summaries = []
+    for use_pregel in (True, False):
+        config = LangGraphAgentConfig(enable_simulation=False, use_pregel=use_pregel)
+        agent = LangGraphQuantumAgent(ChainMockClient(), config)
+        summaries.append(agent.run_autonomous(max_iterations=10, verbose=False))
+
+    assert summaries[0] == summaries[1], f"Executors disagree: {summaries[0]} vs {summaries[1]}"
+    assert summaries[1]['successful_claims'] == 2, "Should claim both edges"
+    print(f"✓ Same summary from both executors: {summaries[1]}")
+
+    # Iteration cap ends the run the same way in both
+    capped = []
+    for use_pregel in (True, False):
+        config = LangGraphAgentConfig(enable_simulation=False, use_pregel=use_pregel)
+        agent = LangGraphQuantumAgent(ChainMockClient(), config)
+        capped.append(agent.run_autonomous(max_iterations=1, verbose=False))
+
+    assert capped[0] == capped[1], f"Capped runs disagree: {capped[0]} vs {capped[1]}"
+    assert capped[1]['iterations'] == 1
+    assert capped[1]['stop_reason'] == 'Max iterations reached'
+    print("✓ Iteration cap matches")
+
+    return True
+
+
+def test_collect_claims_partial_failure():
+    """Test that a raising attempt doesn't hide a parallel attempt that claimed the edge."""
+    print("\n=== Test: Collect Parallel Claims ===")
+
+    def claim(result=None, error=None):
+        def call():
+            if error is not None:
+                raise error
+            return result
+        return _claim_result(call)
+
+    edge = ('A', 'B')
+    results = [claim(error=ConnectionError("reset")), claim({'ok': True, 'data': {'fidelity': 0.9}})]
+    success, response, outcomes = _collect_claims(results, edge)
+    assert success, "Successful attempt should win over one that raised"
+    assert response['data']['fidelity'] == 0.9
+    assert outcomes == [False, True], f"Per-attempt outcomes: {outcomes}"
+    print("✓ Success found after an attempt raised")
+
+    success, response, outcomes = _collect_claims([claim(error=TimeoutError("slow"))], edge)
+    assert not success
+    assert outcomes == [False]
+    assert response['error']['code'] == 'EXCEPTION'
+    print(f"✓ Raising attempt reported as a failed claim: {response['error']}")
+
+    # Single attempts run inline; parallel attempts resolve inside the node
+    class FlakyClient:
+        """First claim raises, later ones succeed."""
+        def __init__(self):
+            self.calls = itertools.count()
+        def claim_edge(self, edge, circuit, flag_bit, num_bell_pairs):
+            if next(self.calls) == 0:
+                raise ConnectionError("reset")
+            return {'ok': True}
+
+    selected = EdgeScore(edge_id=edge, priority=1.0, expected_utility=1.0, expected_cost=2,
+                         roi=0.5, difficulty=1, threshold=0.8, target_node_utility=1,
+                         estimated_success_prob=0.5)
+    state = {
+        'action': 'continue', 'selected_edge': selected, 'should_submit': True,
+        'circuit': None, 'flag_bit': 0, 'num_bell_pairs': 2, 'current_budget': 50,
+        'estimated_success_prob': 0.5, 'attempt_history': {},
+    }
+    single = ExecutionNode(client=FlakyClient(), config=LangGraphAgentConfig(max_parallel_attempts=1))
+    assert single._pool is None, "No pool without parallel attempts"
+    result = single(state)
+    assert result['execution_outcomes'] == (False,), f"Inline claim outcome: {result}"
+    assert result['execution_response']['error']['code'] == 'EXCEPTION'
+    single.close()
+    print("✓ Single claim runs inline without a pool")
+
+    node = ExecutionNode(client=FlakyClient(), config=LangGraphAgentConfig(max_parallel_attempts=2))
+    result = node(state)
+    assert result['execution_attempts'] == 2, f"Expected 2 parallel attempts: {result}"
+    assert result['execution_success'], "Second attempt claimed the edge"
+    assert sorted(result['execution_outcomes']) == [False, True]
+    pickle.dumps(result)  # checkpointers serialize graph state; no futures in it
+    print("✓ Node returns resolved, picklable results")
+
+    # The claim pool is released by close()
+    node.close()
+    try:
+        node._pool.submit(print)
+        assert False, "Pool should be shut down"
+    except RuntimeError:
+        print("✓ ExecutionNode.close() shuts down the claim pool")
+
+    return True
+
+
+def test_update_state_counts_parallel_attempts():
+    """Test that UpdateState counts every parallel attempt, one success per edge."""
+    print("\n=== Test: Parallel Attempt Counters ===")
+
+    class StatusClient:
+        def get_state_bundle(self):
+            return {'status': {'budget': 50, 'score': 0, 'owned_nodes': ['A'], 'owned_edges': []},
+                    'claimable_edges': []}
+
+
+    edge = EdgeScore(edge_id=('A', 'B'), priority=1.0, expected_utility=1.0, expected_cost=2,
+                     roi=0.5, difficulty=1, threshold=0.8, target_node_utility=1,
+                     estimated_success_prob=0.5)
+    config = LangGraphAgentConfig(enable_simulation=False)
+    node = UpdateStateNode(BudgetManager(), config, StatusClient())
+
+    def run(results):
+        state = {
+            'action': 'continue', 'selected_edge': edge, 'iteration': 0,
+            'execution_attempts': len(results), 'execution_success': any(results),
+            'execution_outcomes': tuple(results),
+            'attempt_history': {}, 'num_bell_pairs': 2, 'graph': {'nodes': [], 'edges': []},
+            'initial_budget': 60, '_claimables_version': 0,
+        }
+        return node(state)
+
+    updates = run([False, False, False])
+    assert updates.get('failed_attempts') == 3, f"All 3 failures should count: {updates}"
+    assert 'successful_claims' not in updates
+    assert updates['attempt_history'][('A', 'B')] == 3
+    print("✓ 3 failed attempts counted as 3")
+
+    updates = run([True, False, True])
+    assert updates.get('successful_claims') == 1, f"One edge gained, one success: {updates}"
+    assert updates.get('failed_attempts') == 2, f"Duplicate ok response is a wasted attempt: {updates}"
+    print("✓ 2 ok + 1 failed counted as 1 success and 2 wasted attempts")
+
+    return True
+
+
+def test_claim_by_protocol_fallback():
+    """Test protocol-only claims and the QASM fallback on UNSUPPORTED_PROTOCOL."""
+    print("\n=== Test: Claim by Protocol ===")
+
+    class RecordingClient(GameClient):
+        """Answers protocol-only claims with protocol_error, QASM claims with ok."""
+        def __init__(self, protocol_error):
+            super().__init__(api_token='token', disk_cache=False)
+            self.player_id = 'p1'
+            self.protocol_error = protocol_error
+            self.payloads = []
+
+        def _post(self, path, payload, require_auth=True):
+            self.payloads.append(payload)
+            if 'protocol' in payload:
+                return {'ok': False, 'error': {'code': self.protocol_error, 'message': 'rejected'}}
+            return {'ok': True}
+
+    edge = EdgeScore(edge_id=('A', 'B'), priority=1.0, expected_utility=1.0, expected_cost=2,
+                     roi=0.5, difficulty=1, threshold=0.8, target_node_utility=1,
+                     estimated_success_prob=0.5)
+    state = {
+        'action': 'continue', 'selected_edge': edge, 'should_submit': True,
+        'protocol': 'dejmps', 'circuit': None, 'flag_bit': 0, 'num_bell_pairs': 2,
+        'current_budget': 50, 'estimated_success_prob': 0.5, 'attempt_history': {},
+    }
+    config = LangGraphAgentConfig(claim_by_protocol=True)
+
+    client = RecordingClient('UNSUPPORTED_PROTOCOL')
+    node = ExecutionNode(client, config)
+    assert node(state)['execution_success'], "Fallback QASM claim should succeed"
+    assert [('protocol' in p, 'circuit_qasm' in p) for p in client.payloads] == [(True, False), (False, True)]
+    node(state)
+    assert 'circuit_qasm' in client.payloads[-1] and len(client.payloads) == 3, \
+        "Fallback should be remembered for later claims"
+    print("✓ UNSUPPORTED_PROTOCOL falls back to QASM once, then stays on QASM")
+
+    client = RecordingClient('HTTP_ERROR')
+    result = ExecutionNode(client, config)(state)
+    assert not result['execution_success'] and len(client.payloads) == 1, \
+        "Other errors are real rejections and must not be resubmitted"
+    print("✓ Other errors are returned without a QASM resubmission")
+
+    return True
+
+
 def run_all_tests():
     """Run all test suites."""
     print("\n" + "=" * 70)
@@ -515,12 +834,17 @@ def run_all_tests():
     tests = [
         ("State Initialization", test_state_initialization),
         ("Edge Selection Node", test_edge_selection_node),
+        ("Edge Selection Skip Advancement", test_edge_selection_skip_advances),
         ("Resource Allocation Node", test_resource_allocation_node),
         ("Distillation Strategy Node", test_distillation_strategy_node),
         ("Simulation Check Node", test_simulation_check_node),
         ("Control Flow", test_control_flow),
         ("Budget Constraints", test_budget_constraints),
         ("Full Graph Execution", test_full_graph_execution),
+        ("Direct Executor vs Pregel", test_direct_executor_matches_pregel),
+        ("Collect Parallel Claims", test_collect_claims_partial_failure),
+        ("Parallel Attempt Counters", test_update_state_counts_parallel_attempts),
+        ("Claim by Protocol", test_claim_by_protocol_fallback),
     ]
     
     passed = 0
@@ -5,11 +5,14 @@ Tests strategy, budget management, and decision logic.
 """
 
 import sys
+import numpy as np
+from strategy._kernels import _pick_best_edge_loop, _pick_best_edge_numpy
 from strategy.strategy import (
     EdgeSelectionStrategy,
     BudgetManager,
     AdaptiveDistillationPlanner,
-    EdgeScore
+    EdgeScore,
+    edge_score_arrays
 )
 
 
@@ -82,6 +85,83 @@ def test_edge_selection():
     return True
 
 
+def test_vectorized_selection_matches_ranking():
+    """Test that vectorized select_best_edge agrees with scalar ranking."""
+    print("\n" + "=" * 60)
+    print("Testing Vectorized Edge Selection")
+    print("=" * 60)
+    
+    strategy = EdgeSelectionStrategy()
+    
+    edges = [
+        {'edge_id': ('A', 'B'), 'difficulty_rating': 3.0, 'base_threshold': 0.85},
+        {'edge_id': ('A', 'C'), 'difficulty_rating': 7.0, 'base_threshold': 0.92},
+        {'edge_id': ('D', 'A'), 'difficulty_rating': 2.0, 'base_threshold': 0.80},
+        {'edge_id': ('A', 'E'), 'difficulty_rating': 4.0, 'base_threshold': 0.88}  # E not in graph
+    ]
+    
+    graph = {
+        'nodes': [
+            {'node_id': 'A', 'utility_qubits': 5, 'bonus_bell_pairs': 10},
+            {'node_id': 'B', 'utility_qubits': 10, 'bonus_bell_pairs': 5},
+            {'node_id': 'C', 'utility_qubits': 15, 'bonus_bell_pairs': 8},
+            {'node_id': 'D', 'utility_qubits': 8, 'bonus_bell_pairs': 12}
+        ]
+    }
+    
+    status = {'owned_nodes': ['A'], 'budget': 75}
+    
+    ranked = strategy.rank_edges(edges, graph, status)
+    best = strategy.select_best_edge(edges, graph, status, budget_threshold=10)
+    
+    print(f"  Ranked top: {ranked[0].edge_id} (priority={ranked[0].priority:.2f})")
+    print(f"  Selected:   {best.edge_id} (priority={best.priority:.2f})")
+    
+    assert best.edge_id == ranked[0].edge_id, "Vectorized pick should match top-ranked edge"
+    assert abs(best.priority - ranked[0].priority) < 1e-9, "Priorities should match"
+    assert abs(best.roi - ranked[0].roi) < 1e-9, "ROI should match"
+    
+    # Budget filter: with a tight budget the pick must still keep the reserve
+    status = {'owned_nodes': ['A'], 'budget': 14}
+    best = strategy.select_best_edge(edges, graph, status, budget_threshold=10)
+    assert status['budget'] - best.expected_cost >= 10, "Should respect reserve when possible"
+    
+    print("\n✓ Vectorized selection tests passed")
+    return True
+
+
+def test_pick_best_edge_kernels():
+    """Test that the loop kernel (what numba compiles) matches the NumPy fallback."""
+    print("\n" + "=" * 60)
+    print("Testing Edge Pick Kernels")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(7)
+    weights = (1.0, 0.5, 0.3, 0.4)
+    for trial in range(50):
+        n = int(rng.integers(0, 12))
+        utility = rng.integers(0, 20, n).astype(float)
+        bonus = rng.integers(0, 15, n).astype(float)
+        difficulty = rng.integers(1, 10, n).astype(float)
+        success_prob = rng.choice([0.1, 0.5, 0.9], n)
+        expected_cost = rng.integers(2, 9, n).astype(float)
+        has_target = rng.random(n) < 0.8
+        if n > 1 and trial % 2:
+            # Duplicate rows: ties must resolve to the lowest index in both
+            for arr in (utility, bonus, difficulty, success_prob, expected_cost, has_target):
+                arr[-1] = arr[0]
+        budget = float(rng.integers(0, 30))
+        
+        args = (utility, bonus, difficulty, success_prob, expected_cost, has_target, *weights, budget, 10.0)
+        loop = _pick_best_edge_loop(*args)
+        fallback = _pick_best_edge_numpy(*args)
+        assert loop == fallback, f"Kernels disagree (n={n}, budget={budget}): {loop} vs {fallback}"
+    
+    print("  50 random edge sets: loop and NumPy picks agree")
+    print("\n✓ Kernel tests passed")
+    return True
+
+
 def test_budget_manager():
     """Test budget management."""
     print("\n" + "=" * 60)
@@ -166,7 +246,14 @@ def test_budget_manager():
     print(f"  Reason: {reason}")
     assert not should_attempt, "Should reject after max retries"
     
-    print("\nTest 5: Risk tolerance adjustment")
+    print("\nTest 5: Batch filter matches per-edge decisions")
+    edges = [good_edge, expensive_edge, low_roi_edge]
+    mask = manager.filter_edges(edge_score_arrays(edges), current_budget)
+    expected = [manager.should_attempt_edge(edge, current_budget)[0] for edge in edges]
+    print(f"  Mask: {mask.tolist()}")
+    assert mask.tolist() == expected, "filter_edges should match should_attempt_edge"
+    
+    print("\nTest 6: Risk tolerance adjustment")
     manager.adjust_risk_tolerance(10, 100)  # 10% budget remaining
     print(f"  Risk tolerance after low budget: {manager.risk_tolerance}")
     assert manager.risk_tolerance > 0.5, "Should be more conservative with low budget"
@@ -257,6 +344,16 @@ def test_distillation_planner():
             f"Expected {test['expected_min']}-{test['expected_max']}, got {pairs}"
         assert 2 <= pairs <= 8, "Pairs should be in valid range [2, 8]"
     
+    # Tier bounds are inclusive: difficulty 3.0 / threshold 0.85 stay in the lower tier
+    print("\nTest: Bell pair tier bounds")
+    for (d, t), expected in [((3.0, 0.85), 2), ((3.5, 0.86), 4), ((6.0, 0.92), 4), ((6.1, 0.93), 6), ((9.0, 0.5), 4)]:
+        score = EdgeScore(
+            edge_id=('A', 'B'), priority=0.0, expected_utility=0.0, expected_cost=2.0, roi=0.0,
+            difficulty=d, threshold=t, target_node_utility=0, estimated_success_prob=0.5
+        )
+        pairs = planner.determine_bell_pair_count(score, 100, 0)
+        assert pairs == expected, f"Tier mismatch for difficulty={d}, threshold={t}: got {pairs}"
+    
     print("\n✓ Distillation planner tests passed")
     return True
 
@@ -330,6 +427,8 @@ def run_all_tests():
     
     try:
         test_edge_selection()
+        test_vectorized_selection_matches_ranking()
+        test_pick_best_edge_kernels()
         test_budget_manager()
         test_distillation_planner()
         test_integration()
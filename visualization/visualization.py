@@ -2,14 +2,12 @@
 GraphTool - Client-side visualization for the quantum network graph.
 """
 
+from importlib.util import find_spec
 from typing import Dict, List, Optional, Set, Tuple
 import networkx as nx
 
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+# pyplot is only needed by render(); import it there so loading GraphTool stays cheap
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
 
 
 class GraphTool:
@@ -96,6 +94,8 @@ class GraphTool:
             print("matplotlib not installed. Install with: pip install matplotlib")
             return
 
+        import matplotlib.pyplot as plt
+
         owned_nodes = owned_nodes or set()
 
         # Create focused view if owned nodes exist